@@ -0,0 +1,110 @@
+"""
+exporter.py
+Streaming export hasil optimasi (CSV / NDJSON)
+
+Baris kelompoks JOIN data dibaca lewat server-side cursor dan ditulis per
+kelompok, sehingga pemakaian memori hanya sebesar satu kelompok.
+"""
+
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Dict, Iterable, List
+
+import pandas as pd
+from sqlalchemy import select
+
+from app.ga_engine import compute_expected_sizes, evaluate_group_constraints, normalize_htq
+from database.database import AsyncSessionLocal
+from database.models import Data, Kelompok
+
+EXPORT_COLUMNS = [
+    'kelompok',
+    'id_mahasiswa',
+    'jenis_kelamin',
+    'jurusan',
+    'htq',
+    'C1_HTQ',
+    'C2_Heterogenitas_Jurusan',
+    'C3_Proporsi_Gender',
+    'C4_Jumlah_Anggota',
+    'score',
+]
+
+MEDIA_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+def format_rows(rows: Iterable[Dict[str, Any]], fmt: str) -> str:
+    """Serialisasi baris export ke CSV / NDJSON"""
+    if fmt == 'ndjson':
+        return ''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in rows)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS, lineterminator='\n')
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def format_header(fmt: str) -> str:
+    """Header CSV (NDJSON tidak punya header)"""
+    return ','.join(EXPORT_COLUMNS) + '\n' if fmt == 'csv' else ''
+
+
+def score_group(kelompok: int, members: List[Any], PL: float, PP: float, expected_size: int) -> List[Dict[str, Any]]:
+    """Hitung constraint C1-C4 satu kelompok dan gabungkan ke setiap baris anggotanya"""
+    group_df = pd.DataFrame({
+        'ID': [m.id for m in members],
+        'Jenis_Kelamin': [m.jenis_kelamin for m in members],
+        'Jurusan': [m.jurusan for m in members],
+        'HTQ': [normalize_htq(m.htq) for m in members],
+    })
+    constraints = evaluate_group_constraints(group_df, PL, PP, expected_size)
+    score = sum(constraints.values())
+    return [
+        {
+            'kelompok': kelompok,
+            'id_mahasiswa': m.id,
+            'jenis_kelamin': m.jenis_kelamin,
+            'jurusan': m.jurusan,
+            'htq': m.htq,
+            **constraints,
+            'score': score,
+        }
+        for m in members
+    ]
+
+
+async def stream_export(id_optimasi: int, fmt: str, jumlah_kelompok: int, N: int,
+                        PL: float, PP: float, batch_size: int = 1000) -> AsyncIterator[str]:
+    """
+    Generator untuk StreamingResponse: header langsung dikirim, lalu baris
+    di-stream dari cursor (ORDER BY kelompok) dan di-flush setiap satu kelompok selesai.
+    Session dibuka sendiri karena generator berjalan setelah handler selesai.
+    """
+    expected_sizes = compute_expected_sizes(N, jumlah_kelompok)
+    header = format_header(fmt)
+    if header:
+        yield header
+
+    stmt = (
+        select(Kelompok.kelompok, Data.id, Data.jenis_kelamin, Data.jurusan, Data.htq)
+        .join(Data, Kelompok.id_data == Data.id)
+        .where(Kelompok.id_optimasi == id_optimasi)
+        .order_by(Kelompok.kelompok, Data.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(stmt)
+        current = None
+        members: List[Any] = []
+        async for row in result:
+            if row.kelompok != current and members:
+                yield format_rows(score_group(current, members, PL, PP, expected_sizes[current - 1]), fmt)
+                members = []
+            current = row.kelompok
+            members.append(row)
+        if members:
+            yield format_rows(score_group(current, members, PL, PP, expected_sizes[current - 1]), fmt)
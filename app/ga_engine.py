@@ -3,22 +3,37 @@ ga_engine.py
 GA algorithm wrapper - Konversi dari algen.ipynb ke production code
 """
 
+import hashlib
 import pandas as pd
 import numpy as np
 import time
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Callable, NamedTuple
+
+from app.ga_kernels import KernelBackend, get_backend
 
 
 # ========================================
 # DATA PREPROCESSING
 # ========================================
 
+def normalize_htq(value: Any) -> int:
+    """Normalize status HTQ ke biner (1 = HTQ)"""
+    return 1 if str(value).lower() in ['ya', 'lulus', '1', 'y', 't', 'true'] else 0
+
+
+def compute_expected_sizes(N: int, K: int) -> List[int]:
+    """Expected size tiap kelompok: sisa N % K dibagi ke kelompok pertama"""
+    A = N // K
+    sisa = N % K
+    return [A + 1 if i < sisa else A for i in range(K)]
+
+
 def preprocess_data(df: pd.DataFrame, jumlah_kelompok: int) -> Dict[str, Any]:
     """Preprocess data dan hitung semua statistik yang diperlukan"""
     df_clean = df.copy()
     
     # Normalize HTQ to binary
-    df_clean['HTQ'] = df_clean['HTQ'].apply(lambda x: 1 if str(x).lower() in ['ya', 'lulus', '1', 'y', 't', 'true'] else 0)
+    df_clean['HTQ'] = df_clean['HTQ'].apply(normalize_htq)
     
     # Calculate aggregate statistics
     N = len(df_clean)
@@ -34,11 +49,27 @@ def preprocess_data(df: pd.DataFrame, jumlah_kelompok: int) -> Dict[str, Any]:
     A = N // K
     sisa = N % K
     
-    expected_sizes = [A + 1 if i < sisa else A for i in range(K)]
+    expected_sizes = compute_expected_sizes(N, K)
     
     # Max fitness
     max_fitness = K * 4
     
+    # Encode kolom ke array integer untuk kernel fitness
+    # kromosom = permutasi indeks baris (0..N-1), bukan ID mahasiswa
+    ids = df_clean['ID'].to_numpy()
+    htq_arr = df_clean['HTQ'].to_numpy(dtype=np.int64)
+    gender_arr = np.select(
+        [df_clean['Jenis_Kelamin'] == 'LK', df_clean['Jenis_Kelamin'] == 'PR'], [0, 1], 2
+    ).astype(np.int64)
+    major_codes, majors = pd.factorize(df_clean['Jurusan'])
+    major_arr = major_codes.astype(np.int64)
+    n_majors = max(len(majors), 1)
+    bounds = np.concatenate(([0], np.cumsum(expected_sizes))).astype(np.int64)
+    group_labels = np.repeat(np.arange(K, dtype=np.int64), expected_sizes)
+    
+    # Upper bound fitness yang mungkin dicapai dari komposisi kohort
+    upper_bound = estimate_upper_bound(htq_arr, gender_arr, major_arr, expected_sizes, PL, PP)
+    
     return {
         'df_clean': df_clean,
         'N': N,
@@ -50,7 +81,87 @@ def preprocess_data(df: pd.DataFrame, jumlah_kelompok: int) -> Dict[str, Any]:
         'A': A,
         'sisa': sisa,
         'expected_sizes': expected_sizes,
-        'max_fitness': max_fitness
+        'max_fitness': max_fitness,
+        'ids': ids,
+        'htq_arr': htq_arr,
+        'gender_arr': gender_arr,
+        'major_arr': major_arr,
+        'n_majors': n_majors,
+        'bounds': bounds,
+        'group_labels': group_labels,
+        'upper_bound': upper_bound
+    }
+
+
+def _c2_upper_bound(major_arr: np.ndarray, expected_sizes: List[int]) -> int:
+    """
+    Maksimum kelompok yang bisa memenuhi C2.
+    Kelompok berukuran s butuh floor(s/2)+1 jurusan berbeda, dan jurusan dengan
+    c mahasiswa hanya bisa muncul di paling banyak min(c, g) dari g kelompok.
+    """
+    K = len(expected_sizes)
+    if K == 0 or len(major_arr) == 0:
+        return 0
+    major_counts = np.bincount(major_arr)
+    n_majors = int((major_counts > 0).sum())
+    # majors_with_at_least[g] = jumlah jurusan dengan >= g mahasiswa
+    count_hist = np.bincount(major_counts, minlength=K + 2)
+    majors_with_at_least = n_majors - np.concatenate(([0], np.cumsum(count_hist)[:-1]))
+    
+    needs = sorted(size // 2 + 1 for size in expected_sizes)
+    best, total_need, capacity = 0, 0, 0
+    for g, need in enumerate(needs, start=1):
+        total_need += need
+        capacity += int(majors_with_at_least[g]) if g < len(majors_with_at_least) else 0
+        if need <= n_majors and total_need <= capacity:
+            best = g
+    return best
+
+
+def _c3_upper_bound(gender_arr: np.ndarray, expected_sizes: List[int], PL: float, PP: float) -> int:
+    """
+    Maksimum kelompok yang bisa memenuhi C3.
+    Per ukuran kelompok dicari jumlah LK/PR minimum yang lolos toleransi ±10%
+    (rumus sama dengan evaluate_groups), lalu dicek terhadap stok LK dan PR.
+    """
+    L = int((gender_arr == 0).sum())
+    P = int((gender_arr == 1).sum())
+    min_lk, min_pr = [], []
+    for size in expected_sizes:
+        if size == 0:
+            continue
+        counts = np.arange(size + 1)
+        ok_lk = np.flatnonzero(np.abs(counts / size - PL) <= 0.1)
+        ok_pr = np.flatnonzero(np.abs(counts / size - PP) <= 0.1)
+        if len(ok_lk) == 0 or len(ok_pr) == 0 or ok_lk[0] + ok_pr[0] > size:
+            continue
+        min_lk.append(int(ok_lk[0]))
+        min_pr.append(int(ok_pr[0]))
+    
+    # g kelompok memenuhi C3 -> g kebutuhan LK/PR terkecil harus tercukupi
+    lk_needed = np.cumsum(sorted(min_lk))
+    pr_needed = np.cumsum(sorted(min_pr))
+    return int(((lk_needed <= L) & (pr_needed <= P)).sum())
+
+
+def estimate_upper_bound(htq_arr: np.ndarray, gender_arr: np.ndarray, major_arr: np.ndarray,
+                         expected_sizes: List[int], PL: float, PP: float) -> Dict[str, int]:
+    """
+    Upper bound jumlah kelompok yang bisa memenuhi tiap constraint, dihitung dari
+    agregat kohort (O(N)). Total bound = fitness maksimal yang mungkin dicapai.
+    """
+    K = len(expected_sizes)
+    c1 = min(K, int(htq_arr.sum()))
+    c2 = _c2_upper_bound(major_arr, expected_sizes)
+    c3 = _c3_upper_bound(gender_arr, expected_sizes, PL, PP)
+    c4 = K  # Decode selalu menghasilkan ukuran sesuai expected_sizes
+    
+    return {
+        'C1_HTQ': c1,
+        'C2_Heterogenitas_Jurusan': c2,
+        'C3_Proporsi_Gender': c3,
+        'C4_Jumlah_Anggota': c4,
+        'total': c1 + c2 + c3 + c4
     }
 
 
@@ -94,52 +205,159 @@ def evaluate_C4(group_df: pd.DataFrame, expected_size: int) -> int:
     return 1 if len(group_df) == expected_size else 0
 
 
+def evaluate_group_constraints(group_df: pd.DataFrame, PL: float, PP: float, expected_size: int) -> Dict[str, int]:
+    """Evaluasi C1-C4 untuk satu kelompok (kolom HTQ sudah biner)"""
+    return {
+        'C1_HTQ': evaluate_C1(group_df),
+        'C2_Heterogenitas_Jurusan': evaluate_C2(group_df),
+        'C3_Proporsi_Gender': evaluate_C3(group_df, PL, PP),
+        'C4_Jumlah_Anggota': evaluate_C4(group_df, expected_size)
+    }
+
+
 # ========================================
 # KROMOSOM DECODING & FITNESS
 # ========================================
 
 def decode_kromosom(kromosom: np.ndarray, df_clean: pd.DataFrame, expected_sizes: List[int]) -> List[pd.DataFrame]:
-    """Decode permutation kromosom into groups"""
+    """Decode permutation kromosom (indeks baris) into groups"""
     groups = []
     start_idx = 0
     
     for i, size in enumerate(expected_sizes):
         end_idx = start_idx + size
-        group_ids = kromosom[start_idx:end_idx]
-        group_df = df_clean[df_clean['ID'].isin(group_ids)].copy()
+        group_rows = np.sort(kromosom[start_idx:end_idx])
+        group_df = df_clean.iloc[group_rows].copy()
         groups.append(group_df)
         start_idx = end_idx
     
     return groups
 
 
-def calculate_fitness(kromosom: np.ndarray, df_clean: pd.DataFrame, expected_sizes: List[int], PL: float, PP: float) -> int:
+def _group_stats(kromosom: np.ndarray, preprocessed: Dict[str, Any],
+                 kernels: Optional[KernelBackend] = None) -> tuple:
+    """Hitung (sizes, htq, jurusan unik, LK, PR) per kelompok lewat kernel backend"""
+    kernels = kernels or get_backend()
+    htq_cnt, distinct, lk_cnt, pr_cnt = kernels.group_counts(
+        kromosom, preprocessed['group_labels'], preprocessed['bounds'],
+        preprocessed['htq_arr'], preprocessed['gender_arr'],
+        preprocessed['major_arr'], preprocessed['n_majors']
+    )
+    return np.diff(preprocessed['bounds']), htq_cnt, distinct, lk_cnt, pr_cnt
+
+
+def _indicators(stats: tuple, preprocessed: Dict[str, Any]) -> tuple:
+    """Indikator 0/1 C1-C4 per kelompok dari hasil _group_stats"""
+    sizes, htq_cnt, distinct, lk_cnt, pr_cnt = stats
+    expected = np.asarray(preprocessed['expected_sizes'])
+    safe_sizes = np.maximum(sizes, 1)
+    
+    c1 = (htq_cnt >= 1).astype(np.int64)
+    c2 = (distinct > sizes * 0.5).astype(np.int64)
+    lk_dev = np.abs(lk_cnt / safe_sizes - preprocessed['PL'])
+    pr_dev = np.abs(pr_cnt / safe_sizes - preprocessed['PP'])
+    c3 = ((sizes > 0) & (lk_dev <= 0.1) & (pr_dev <= 0.1)).astype(np.int64)
+    c4 = (sizes == expected).astype(np.int64)
+    
+    return c1, c2, c3, c4
+
+
+def _distances(stats: tuple, preprocessed: Dict[str, Any]) -> tuple:
+    """Jarak ke pemenuhan C1-C4 per kelompok dari hasil _group_stats (lihat constraint_distances)"""
+    sizes, htq_cnt, distinct, lk_cnt, pr_cnt = stats
+    expected = np.asarray(preprocessed['expected_sizes'])
+    safe_sizes = np.maximum(sizes, 1)
+    
+    d1 = (htq_cnt < 1).astype(np.float64)
+    d2 = np.maximum(sizes // 2 + 1 - distinct, 0).astype(np.float64)
+    lk_excess = np.maximum(np.abs(lk_cnt / safe_sizes - preprocessed['PL']) - 0.1, 0.0)
+    pr_excess = np.maximum(np.abs(pr_cnt / safe_sizes - preprocessed['PP']) - 0.1, 0.0)
+    d3 = np.ceil(np.maximum(lk_excess, pr_excess) * sizes)
+    d4 = np.abs(sizes - expected).astype(np.float64)
+    
+    return d1, d2, d3, d4
+
+
+def evaluate_groups(kromosom: np.ndarray, preprocessed: Dict[str, Any],
+                    kernels: Optional[KernelBackend] = None) -> tuple:
+    """
+    Evaluasi C1-C4 untuk semua kelompok sekaligus tanpa decode ke DataFrame.
+    Returns tuple array (c1, c2, c3, c4) berukuran K, nilai 0/1.
+    """
+    return _indicators(_group_stats(kromosom, preprocessed, kernels), preprocessed)
+
+
+def constraint_distances(kromosom: np.ndarray, preprocessed: Dict[str, Any],
+                         kernels: Optional[KernelBackend] = None) -> tuple:
+    """
+    Jarak ke pemenuhan tiap constraint per kelompok, dalam satuan jumlah mahasiswa
+    yang harus dipindah/ditambah:
+    - C1: kelompok tanpa HTQ butuh 1 mahasiswa HTQ
+    - C2: jumlah jurusan yang masih kurang agar jurusan unik > 50% anggota
+    - C3: jumlah mahasiswa di luar toleransi ±10% proporsi gender
+    - C4: selisih ukuran kelompok dengan expected size
+    """
+    return _distances(_group_stats(kromosom, preprocessed, kernels), preprocessed)
+
+
+def calculate_fitness(kromosom: np.ndarray, preprocessed: Dict[str, Any],
+                      kernels: Optional[KernelBackend] = None) -> int:
     """Calculate total fitness of a kromosom"""
-    groups = decode_kromosom(kromosom, df_clean, expected_sizes)
-    total_fitness = 0
-    
-    for i, group_df in enumerate(groups):
-        c1 = evaluate_C1(group_df)
-        c2 = evaluate_C2(group_df)
-        c3 = evaluate_C3(group_df, PL, PP)
-        c4 = evaluate_C4(group_df, expected_sizes[i])
-        
-        total_fitness += (c1 + c2 + c3 + c4)
+    c1, c2, c3, c4 = evaluate_groups(kromosom, preprocessed, kernels)
+    return int(c1.sum() + c2.sum() + c3.sum() + c4.sum())
+
+
+# Bobot default per constraint untuk mode fitness graded
+DEFAULT_CONSTRAINT_WEIGHTS = {
+    'C1_HTQ': 1.0,
+    'C2_Heterogenitas_Jurusan': 1.0,
+    'C3_Proporsi_Gender': 1.0,
+    'C4_Jumlah_Anggota': 1.0
+}
+
+# Nilai maksimal yang didapat constraint yang belum terpenuhi (constraint terpenuhi = 1)
+SOFT_CREDIT = 0.5
+
+
+def calculate_graded_fitness(kromosom: np.ndarray, preprocessed: Dict[str, Any],
+                             weights: Optional[Dict[str, float]] = None,
+                             kernels: Optional[KernelBackend] = None) -> tuple:
+    """
+    Fitness graded: constraint terpenuhi bernilai 1, constraint yang belum terpenuhi
+    mendapat soft credit SOFT_CREDIT * (1 - jarak / ukuran kelompok) sehingga partisi
+    yang lebih dekat ke pemenuhan mendapat nilai lebih tinggi. Nilai per constraint
+    dikalikan bobotnya.
     
-    return total_fitness
+    Returns:
+        (score integer seperti calculate_fitness, fitness graded float)
+    """
+    weights = weights or DEFAULT_CONSTRAINT_WEIGHTS
+    stats = _group_stats(kromosom, preprocessed, kernels)
+    safe_sizes = np.maximum(stats[0], 1)
+    
+    score = 0
+    fitness = 0.0
+    for name, satisfied, distance in zip(DEFAULT_CONSTRAINT_WEIGHTS, _indicators(stats, preprocessed),
+                                         _distances(stats, preprocessed)):
+        # Indikator biner tetap acuan; jarak minimal 1 untuk constraint yang belum terpenuhi
+        distance = np.maximum(distance, 1.0)
+        soft = SOFT_CREDIT * np.clip(1.0 - distance / safe_sizes, 0.0, 1.0)
+        score += int(satisfied.sum())
+        fitness += weights.get(name, 1.0) * float(np.where(satisfied == 1, 1.0, soft).sum())
+    
+    return score, fitness
 
 
 # ========================================
 # POPULATION INITIALIZATION
 # ========================================
 
-def initialize_population(df_clean: pd.DataFrame, popsize: int) -> List[np.ndarray]:
-    """Initialize population with random permutations"""
-    student_ids = df_clean['ID'].values
+def initialize_population(N: int, popsize: int, rng: np.random.Generator) -> List[np.ndarray]:
+    """Initialize population with random permutations of row indices"""
     population = []
     
     for _ in range(popsize):
-        kromosom = np.random.permutation(student_ids)
+        kromosom = rng.permutation(N).astype(np.int64)
         population.append(kromosom)
     
     return population
@@ -149,7 +367,8 @@ def initialize_population(df_clean: pd.DataFrame, popsize: int) -> List[np.ndarr
 # PARENT SELECTION
 # ========================================
 
-def select_parents_for_crossover(population: List[np.ndarray], cr: float) -> List[tuple]:
+def select_parents_for_crossover(population: List[np.ndarray], cr: float,
+                                 rng: np.random.Generator) -> List[tuple]:
     """Select parent pairs for crossover based on CR"""
     num_crossover = int(len(population) * cr)
     if num_crossover % 2 != 0:
@@ -162,13 +381,14 @@ def select_parents_for_crossover(population: List[np.ndarray], cr: float) -> Lis
     # Can't select more than population size
     num_crossover = min(num_crossover, len(population))
     
-    indices = np.random.choice(len(population), num_crossover, replace=False)
+    indices = rng.choice(len(population), num_crossover, replace=False)
     parent_pairs = [(population[indices[i]], population[indices[i+1]]) 
                     for i in range(0, num_crossover, 2)]
     return parent_pairs
 
 
-def select_parents_for_mutation(population: List[np.ndarray], mr: float) -> List[np.ndarray]:
+def select_parents_for_mutation(population: List[np.ndarray], mr: float,
+                                rng: np.random.Generator) -> List[np.ndarray]:
     """Select parents for mutation based on MR"""
     num_mutation = int(len(population) * mr)
     
@@ -177,7 +397,7 @@ def select_parents_for_mutation(population: List[np.ndarray], mr: float) -> List
         return []
     
     num_mutation = min(num_mutation, len(population))
-    indices = np.random.choice(len(population), num_mutation, replace=False)
+    indices = rng.choice(len(population), num_mutation, replace=False)
     return [population[i] for i in indices]
 
 
@@ -185,16 +405,18 @@ def select_parents_for_mutation(population: List[np.ndarray], mr: float) -> List
 # PMX CROSSOVER
 # ========================================
 
-def pmx_crossover(parent1: np.ndarray, parent2: np.ndarray) -> tuple:
+def pmx_crossover(parent1: np.ndarray, parent2: np.ndarray, rng: np.random.Generator,
+                  kernels: Optional[KernelBackend] = None) -> tuple:
     """
-    Partially Mapped Crossover (PMX) - Fixed version
-    Prevents infinite loops by following the mapping chain properly
+    Partially Mapped Crossover (PMX)
+    Cut point diambil di sini, repair mapping dikerjakan oleh kernel backend
     """
+    kernels = kernels or get_backend()
     size = len(parent1)
     
     # Choose two random cut points
-    cx_point1 = np.random.randint(0, size)
-    cx_point2 = np.random.randint(0, size)
+    cx_point1 = int(rng.integers(0, size))
+    cx_point2 = int(rng.integers(0, size))
     if cx_point1 > cx_point2:
         cx_point1, cx_point2 = cx_point2, cx_point1
     
@@ -202,39 +424,8 @@ def pmx_crossover(parent1: np.ndarray, parent2: np.ndarray) -> tuple:
     if cx_point1 == cx_point2:
         cx_point2 = min(cx_point1 + 1, size)
     
-    # Initialize offspring as copies
-    child1 = parent1.copy()
-    child2 = parent2.copy()
-    
-    # Swap middle segments
-    child1[cx_point1:cx_point2] = parent2[cx_point1:cx_point2]
-    child2[cx_point1:cx_point2] = parent1[cx_point1:cx_point2]
-    
-    # Fix conflicts using proper PMX algorithm
-    def fix_conflicts_pmx(child, p1, p2, start, end):
-        """Fix conflicts by following the mapping relationship"""
-        middle_values = set(child[start:end])
-        
-        for i in range(size):
-            if i < start or i >= end:
-                if child[i] in middle_values:
-                    value = child[i]
-                    visited = set()
-                    
-                    while value in middle_values and value not in visited:
-                        visited.add(value)
-                        
-                        try:
-                            idx_in_p2 = np.where(p2[start:end] == value)[0][0] + start
-                            value = p1[idx_in_p2]
-                        except (IndexError, TypeError):
-                            break
-                    
-                    if value not in middle_values:
-                        child[i] = value
-    
-    fix_conflicts_pmx(child1, parent1, parent2, cx_point1, cx_point2)
-    fix_conflicts_pmx(child2, parent2, parent1, cx_point1, cx_point2)
+    child1 = kernels.pmx_child(parent1, parent2, cx_point1, cx_point2)
+    child2 = kernels.pmx_child(parent2, parent1, cx_point1, cx_point2)
     
     return child1, child2
 
@@ -243,22 +434,284 @@ def pmx_crossover(parent1: np.ndarray, parent2: np.ndarray) -> tuple:
 # RECIPROCAL EXCHANGE MUTATION
 # ========================================
 
-def reciprocal_exchange_mutation(parent: np.ndarray) -> np.ndarray:
+def reciprocal_exchange_mutation(parent: np.ndarray, rng: np.random.Generator,
+                                 kernels: Optional[KernelBackend] = None) -> np.ndarray:
     """Swap two random genes"""
-    child = parent.copy()
-    idx1, idx2 = np.random.choice(len(child), 2, replace=False)
-    child[idx1], child[idx2] = child[idx2], child[idx1]
+    kernels = kernels or get_backend()
+    idx1, idx2 = rng.choice(len(parent), 2, replace=False)
+    return kernels.swap_genes(parent, int(idx1), int(idx2))
+
+
+# ========================================
+# GROUP ENCODING OPERATORS
+# ========================================
+# Individu = label vector (mahasiswa -> kelompok) dengan ukuran kelompok tetap.
+# Urutan di dalam kelompok tidak mempengaruhi fitness, sehingga ruang pencarian
+# tidak lagi dikalikan faktorial ukuran tiap kelompok seperti pada permutasi.
+
+def initialize_group_population(preprocessed: Dict[str, Any], popsize: int,
+                                rng: np.random.Generator) -> List[np.ndarray]:
+    """Initialize population with random label vectors (ukuran kelompok = expected_sizes)"""
+    group_labels = preprocessed['group_labels']
+    return [rng.permutation(group_labels) for _ in range(popsize)]
+
+
+def permutation_to_labels(kromosom: np.ndarray, preprocessed: Dict[str, Any]) -> np.ndarray:
+    """Konversi permutation ke label vector (mahasiswa -> kelompok)"""
+    labels = np.empty(len(kromosom), dtype=np.int64)
+    labels[kromosom] = preprocessed['group_labels']
+    return labels
+
+
+def group_to_permutation(labels: np.ndarray, preprocessed: Dict[str, Any]) -> np.ndarray:
+    """Konversi label vector ke permutation indeks baris yang dipahami decode_kromosom"""
+    return np.argsort(labels, kind='stable')
+
+
+def _repair_group_sizes(child: np.ndarray, locked: np.ndarray, expected: np.ndarray,
+                        rng: np.random.Generator) -> np.ndarray:
+    """Pindahkan anggota tidak terkunci dari kelompok kelebihan ke kelompok kekurangan"""
+    excess = np.bincount(child, minlength=len(expected)) - expected
+    if not excess.any():
+        return child
+    
+    # Kandidat diacak, lalu ambil excess[g] kandidat pertama dari tiap kelompok g
+    candidates = rng.permutation(np.flatnonzero(~locked))
+    cand_labels = child[candidates]
+    order = np.argsort(cand_labels, kind='stable')
+    sorted_labels = cand_labels[order]
+    rank = np.arange(len(order)) - np.searchsorted(sorted_labels, sorted_labels, side='left')
+    moved = candidates[order[rank < np.maximum(excess, 0)[sorted_labels]]]
+    
+    deficit = np.repeat(np.arange(len(expected)), np.maximum(-excess, 0))
+    child[moved] = rng.permutation(deficit)
     return child
 
 
+def _inject_groups(p_self: np.ndarray, p_other: np.ndarray, g_start: int, g_end: int,
+                   expected: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Salin kelompok [g_start, g_end) dari p_other secara utuh ke salinan p_self"""
+    locked = (p_other >= g_start) & (p_other < g_end)
+    child = p_self.copy()
+    child[locked] = p_other[locked]
+    return _repair_group_sizes(child, locked, expected, rng)
+
+
+def group_injection_crossover(parent1: np.ndarray, parent2: np.ndarray, preprocessed: Dict[str, Any],
+                              rng: np.random.Generator, kernels: Optional[KernelBackend] = None) -> tuple:
+    """
+    Crossover berbasis kelompok (size-preserving)
+    Sebagian kelompok utuh dari parent lain disuntikkan, sisanya diperbaiki agar
+    ukuran kelompok tetap sesuai expected_sizes
+    """
+    K = preprocessed['K']
+    expected = np.asarray(preprocessed['expected_sizes'])
+    
+    # Choose range of kelompok to inject
+    g_start = int(rng.integers(0, K))
+    g_end = int(rng.integers(0, K))
+    if g_start > g_end:
+        g_start, g_end = g_end, g_start
+    if g_start == g_end:
+        g_end = min(g_start + 1, K)
+    
+    child1 = _inject_groups(parent1, parent2, g_start, g_end, expected, rng)
+    child2 = _inject_groups(parent2, parent1, g_start, g_end, expected, rng)
+    
+    return child1, child2
+
+
+def group_swap_mutation(parent: np.ndarray, preprocessed: Dict[str, Any], rng: np.random.Generator,
+                        kernels: Optional[KernelBackend] = None) -> np.ndarray:
+    """Tukar kelompok dua mahasiswa dari kelompok berbeda (ukuran kelompok tetap)"""
+    kernels = kernels or get_backend()
+    idx1 = int(rng.integers(0, len(parent)))
+    candidates = np.flatnonzero(parent != parent[idx1])
+    if len(candidates) == 0:
+        return parent.copy()
+    idx2 = int(rng.choice(candidates))
+    return kernels.swap_genes(parent, idx1, idx2)
+
+
+# ========================================
+# OPERATOR REGISTRY
+# ========================================
+
+class GAOperators(NamedTuple):
+    """Pasangan encoding + operator genetika yang bisa dipilih per run"""
+    name: str
+    initialize: Callable      # (preprocessed, popsize, rng) -> List[individu]
+    crossover: Callable       # (p1, p2, preprocessed, rng, kernels) -> (c1, c2)
+    mutate: Callable          # (parent, preprocessed, rng, kernels) -> child
+    to_permutation: Callable  # (individu, preprocessed) -> permutation indeks baris
+    to_labels: Callable       # (individu, preprocessed) -> label vector (kanonik per partisi)
+
+
+OPERATORS: Dict[str, GAOperators] = {
+    'permutation': GAOperators(
+        'permutation',
+        lambda preprocessed, popsize, rng: initialize_population(preprocessed['N'], popsize, rng),
+        lambda p1, p2, preprocessed, rng, kernels: pmx_crossover(p1, p2, rng, kernels),
+        lambda parent, preprocessed, rng, kernels: reciprocal_exchange_mutation(parent, rng, kernels),
+        lambda kromosom, preprocessed: kromosom,
+        permutation_to_labels,
+    ),
+    'group': GAOperators(
+        'group',
+        initialize_group_population,
+        group_injection_crossover,
+        group_swap_mutation,
+        group_to_permutation,
+        lambda labels, preprocessed: labels,
+    ),
+}
+
+
+def get_operators(encoding: Optional[str] = None) -> GAOperators:
+    """Ambil operator berdasarkan nama encoding (default: permutation + PMX)"""
+    encoding = encoding or 'permutation'
+    if encoding not in OPERATORS:
+        raise ValueError(f"Encoding '{encoding}' tidak dikenal (tersedia: {list(OPERATORS.keys())})")
+    return OPERATORS[encoding]
+
+
+# ========================================
+# FITNESS CACHE
+# ========================================
+
+class FitnessEvaluator:
+    """
+    Hitung fitness dengan cache per partisi.
+    Individu yang menghasilkan partisi sama (mis. hanya beda urutan anggota
+    di dalam kelompok) tidak dievaluasi ulang.
+    
+    fitness_mode 'binary' memakai score integer C1-C4 sebagai fitness seleksi,
+    'graded' memakai calculate_graded_fitness. Score integer dan individu
+    dengan score terbaik selalu dicatat untuk kriteria penghentian dan hasil akhir.
+    """
+
+    def __init__(self, preprocessed: Dict[str, Any], operators: GAOperators,
+                 kernels: Optional[KernelBackend] = None, max_cache_size: int = 100_000,
+                 fitness_mode: str = 'binary', weights: Optional[Dict[str, float]] = None):
+        if fitness_mode not in ('binary', 'graded'):
+            raise ValueError(f"fitness_mode '{fitness_mode}' tidak dikenal (tersedia: ['binary', 'graded'])")
+        self.preprocessed = preprocessed
+        self.operators = operators
+        self.kernels = kernels or get_backend()
+        self.max_cache_size = max_cache_size
+        self.fitness_mode = fitness_mode
+        self.weights = {**DEFAULT_CONSTRAINT_WEIGHTS, **(weights or {})}
+        # Fitness maksimal pada satuan fitness seleksi (graded: semua constraint terpenuhi x bobot)
+        self.max_fitness = (preprocessed['K'] * sum(self.weights.values()) if fitness_mode == 'graded'
+                            else preprocessed['max_fitness'])
+        self.cache: Dict[bytes, tuple] = {}
+        self.evaluations = 0
+        self.cache_hits = 0
+        self.best_score = -1
+        self.best_fitness = None
+        self.best_individual = None
+
+    def partition_key(self, individual: np.ndarray) -> bytes:
+        """Digest label vector sebagai identitas partisi"""
+        labels = self.operators.to_labels(individual, self.preprocessed)
+        return hashlib.blake2b(labels.astype(np.int32).tobytes(), digest_size=16).digest()
+
+    def __call__(self, individual: np.ndarray) -> float:
+        key = self.partition_key(individual)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached[1]
+        
+        perm = self.operators.to_permutation(individual, self.preprocessed)
+        if self.fitness_mode == 'graded':
+            score, fitness = calculate_graded_fitness(perm, self.preprocessed, self.weights, self.kernels)
+        else:
+            score = fitness = calculate_fitness(perm, self.preprocessed, self.kernels)
+        self.evaluations += 1
+        
+        # Best dicatat berdasarkan score integer (fitness graded sebagai tie-breaker)
+        if score > self.best_score or (score == self.best_score and fitness > self.best_fitness):
+            self.best_score = score
+            self.best_fitness = fitness
+            self.best_individual = individual.copy()
+        
+        if len(self.cache) >= self.max_cache_size:
+            self.cache.clear()
+        self.cache[key] = (score, fitness)
+        return fitness
+
+
+# ========================================
+# ADAPTIVE RATES & RESTART
+# ========================================
+
+# Default batas rate jika mode adaptive aktif tanpa batas dari user
+ADAPTIVE_DEFAULTS = {
+    'cr_min': 0.3,
+    'cr_max': 0.9,
+    'mr_min': 0.1,
+    'mr_max': 0.7,
+    'stagnation_limit': 0,
+    'restart_fraction': 0.5
+}
+
+
+def measure_diversity(population: List[np.ndarray], population_fitness: List[float],
+                      evaluator: FitnessEvaluator) -> Dict[str, float]:
+    """
+    Metrik diversity murah: jumlah partisi berbeda, variansi dan standar deviasi fitness
+    """
+    distinct = len({evaluator.partition_key(ind) for ind in population})
+    variance = float(np.var(population_fitness))
+    return {
+        'distinct_partitions': distinct,
+        'fitness_variance': variance,
+        'fitness_std': float(np.sqrt(variance))
+    }
+
+
+def adapt_rates(diversity: Dict[str, float], popsize: int, cr_bounds: tuple, mr_bounds: tuple,
+                reference_std: float) -> tuple:
+    """
+    Atur cr dan mr di dalam batas user berdasarkan tingkat konvergensi populasi.
+    Populasi konvergen -> crossover dikurangi (anak identik dengan parent), mutasi ditambah.
+    Sebaran fitness diukur relatif terhadap reference_std (standar deviasi fitness populasi
+    acak generasi 0), sehingga 1 berarti seberagam populasi awal, berapapun K dan fitness_mode.
+    """
+    partition_div = (diversity['distinct_partitions'] - 1) / max(popsize - 1, 1)
+    if reference_std > 0:
+        fitness_div = min(1.0, diversity['fitness_std'] / reference_std)
+    else:
+        # Populasi awal seragam: hanya ada/tidaknya sebaran yang bermakna
+        fitness_div = 1.0 if diversity['fitness_std'] > 0 else 0.0
+    convergence = 1.0 - 0.5 * (partition_div + fitness_div)
+    
+    cr = cr_bounds[1] - (cr_bounds[1] - cr_bounds[0]) * convergence
+    mr = mr_bounds[0] + (mr_bounds[1] - mr_bounds[0]) * convergence
+    return cr, mr
+
+
+def partial_restart(population: List[np.ndarray], population_fitness: List[float], restart_fraction: float,
+                    preprocessed: Dict[str, Any], operators: GAOperators, evaluator: FitnessEvaluator,
+                    rng: np.random.Generator) -> tuple:
+    """Ganti individu terburuk (populasi sudah terurut) dengan individu acak baru, elite dipertahankan"""
+    n_restart = min(int(len(population) * restart_fraction), len(population) - 1)
+    if n_restart <= 0:
+        return population, population_fitness
+    
+    keep = len(population) - n_restart
+    fresh = operators.initialize(preprocessed, n_restart, rng)
+    return population[:keep] + fresh, population_fitness[:keep] + [evaluator(ind) for ind in fresh]
+
+
 # ========================================
 # ELITISM REPLACEMENT STRATEGY
 # ========================================
 
-def elitism_replacement_optimized(population: List[np.ndarray], population_fitness: List[int], 
-                                   offspring: List[np.ndarray], df_clean: pd.DataFrame, 
-                                   expected_sizes: List[int], PL: float, PP: float, 
-                                   popsize: int) -> tuple:
+def elitism_replacement_optimized(population: List[np.ndarray], population_fitness: List[float], 
+                                   offspring: List[np.ndarray], popsize: int,
+                                   evaluator: FitnessEvaluator) -> tuple:
     """
     Optimized elitism with fitness caching.
     Only calculates fitness for NEW offspring, reuses existing population fitness.
@@ -273,8 +726,7 @@ def elitism_replacement_optimized(population: List[np.ndarray], population_fitne
         return new_population, new_fitness
     
     # Calculate fitness ONLY for new offspring
-    offspring_fitness = [calculate_fitness(ind, df_clean, expected_sizes, PL, PP) 
-                        for ind in offspring]
+    offspring_fitness = [evaluator(ind) for ind in offspring]
     
     # Combine populations and fitness scores
     combined = population + offspring
@@ -292,6 +744,39 @@ def elitism_replacement_optimized(population: List[np.ndarray], population_fitne
     return new_population, new_fitness
 
 
+# ========================================
+# FEASIBILITY PRECHECK
+# ========================================
+
+def precheck_feasibility(data: List[Dict[str, Any]], parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Cek apakah target fitness mungkin dicapai sebelum GA dijalankan.
+    
+    Returns:
+        Dict berisi upper bound per constraint, upper bound fitness total,
+        dan target efektif yang dipakai sebagai kriteria penghentian
+    """
+    jumlah_kelompok = parameters.get('jumlah_kelompok')
+    target_fitness = parameters.get('kriteria_penghentian', parameters.get('target_fitness'))
+    
+    preprocessed = preprocess_data(pd.DataFrame(data), jumlah_kelompok)
+    max_fitness = preprocessed['max_fitness']
+    upper_bound = preprocessed['upper_bound']
+    upper_bound_normalized = upper_bound['total'] / max_fitness if max_fitness > 0 else 0.0
+    
+    return {
+        'jumlah_mahasiswa': int(preprocessed['N']),
+        'jumlah_kelompok': int(preprocessed['K']),
+        'max_fitness': int(max_fitness),
+        'upper_bound': {key: value for key, value in upper_bound.items() if key != 'total'},
+        'upper_bound_fitness': int(upper_bound['total']),
+        'upper_bound_normalized_fitness': float(upper_bound_normalized),
+        'kriteria_penghentian': float(target_fitness),
+        'effective_kriteria_penghentian': float(min(target_fitness, upper_bound_normalized)),
+        'target_reachable': bool(target_fitness * max_fitness <= upper_bound['total'])
+    }
+
+
 # ========================================
 # MAIN GA FUNCTION
 # ========================================
@@ -302,7 +787,11 @@ def run_genetic_algorithm(data: List[Dict[str, Any]], parameters: Dict[str, Any]
     
     Args:
         data: List of dict mahasiswa data
-        parameters: Dict of GA parameters (popsize, generation, cr, mr, kriteria_penghentian, jumlah_kelompok)
+        parameters: Dict of GA parameters (popsize, generation, cr, mr, kriteria_penghentian, jumlah_kelompok,
+                    seed opsional, encoding opsional: 'permutation' / 'group',
+                    backend opsional: 'numba' / 'numpy', adaptive opsional beserta
+                    cr_min/cr_max/mr_min/mr_max/stagnation_limit/restart_fraction,
+                    fitness_mode opsional: 'binary' / 'graded' beserta constraint_weights)
         
     Returns:
         Dict containing kelompok_list, statistics, and kelompok_details
@@ -314,6 +803,24 @@ def run_genetic_algorithm(data: List[Dict[str, Any]], parameters: Dict[str, Any]
     mr = parameters.get('mr')
     max_generation = parameters.get('generation', parameters.get('max_generation'))  # Support both
     target_fitness = parameters.get('kriteria_penghentian', parameters.get('target_fitness'))  # Support both
+    seed = parameters.get('seed')
+    kernels = get_backend(parameters.get('backend'))
+    operators = get_operators(parameters.get('encoding'))
+    rng = np.random.default_rng(seed)
+    fitness_mode = parameters.get('fitness_mode') or 'binary'
+    constraint_weights = parameters.get('constraint_weights')
+    
+    # Adaptive mode: None berarti pakai ADAPTIVE_DEFAULTS
+    adaptive = bool(parameters.get('adaptive', False))
+    adaptive_params = {
+        key: parameters.get(key) if parameters.get(key) is not None else default
+        for key, default in ADAPTIVE_DEFAULTS.items()
+    }
+    cr_bounds = (adaptive_params['cr_min'], adaptive_params['cr_max'])
+    mr_bounds = (adaptive_params['mr_min'], adaptive_params['mr_max'])
+    if adaptive:
+        cr = min(max(cr, cr_bounds[0]), cr_bounds[1])
+        mr = min(max(mr, mr_bounds[0]), mr_bounds[1])
     
     # Convert data to DataFrame
     df = pd.DataFrame(data)
@@ -328,64 +835,91 @@ def run_genetic_algorithm(data: List[Dict[str, Any]], parameters: Dict[str, Any]
     expected_sizes = preprocessed['expected_sizes']
     max_fitness = preprocessed['max_fitness']
     
+    # Target tidak boleh melebihi upper bound, agar GA tidak mengejar target mustahil
+    upper_bound_fitness = preprocessed['upper_bound']['total']
+    target_score = min(target_fitness * max_fitness, upper_bound_fitness)
+    
     # Validation
     if len(data) < jumlah_kelompok:
         raise ValueError(f"Jumlah mahasiswa ({len(data)}) harus >= jumlah kelompok ({jumlah_kelompok})")
     
     # Initialize
     start_time = time.time()
-    population = initialize_population(df_clean, popsize)
+    population = operators.initialize(preprocessed, popsize, rng)
+    evaluator = FitnessEvaluator(preprocessed, operators, kernels,
+                                 fitness_mode=fitness_mode, weights=constraint_weights)
     
     # Calculate initial fitness
     population_fitness = []
     for kromosom in population:
-        fitness = calculate_fitness(kromosom, df_clean, expected_sizes, PL, PP)
+        fitness = evaluator(kromosom)
         population_fitness.append(fitness)
     
-    # Track best solution
-    best_overall_fitness = max(population_fitness)
-    best_overall_solution = population[population_fitness.index(best_overall_fitness)].copy()
+    # Track best solution (score integer, dicatat evaluator)
+    best_overall_fitness = evaluator.best_score
+    
+    # Sebaran fitness populasi acak sebagai acuan diversity penuh (adaptive rates)
+    reference_std = float(np.std(population_fitness))
     
     # Main GA Loop
     generation = 0
+    stagnant_generations = 0
+    restarts = 0
     for generation in range(1, max_generation + 1):
+        # Adaptive rates berdasarkan diversity populasi saat ini
+        if adaptive:
+            diversity = measure_diversity(population, population_fitness, evaluator)
+            cr, mr = adapt_rates(diversity, popsize, cr_bounds, mr_bounds, reference_std)
+        
         # Crossover
-        parent_pairs = select_parents_for_crossover(population, cr)
+        parent_pairs = select_parents_for_crossover(population, cr, rng)
         offspring_cx = []
         for p1, p2 in parent_pairs:
-            c1, c2 = pmx_crossover(p1, p2)
+            c1, c2 = operators.crossover(p1, p2, preprocessed, rng, kernels)
             offspring_cx.extend([c1, c2])
         
         # Mutation
-        parents_mut = select_parents_for_mutation(population, mr)
-        offspring_mut = [reciprocal_exchange_mutation(p) for p in parents_mut]
+        parents_mut = select_parents_for_mutation(population, mr, rng)
+        offspring_mut = [operators.mutate(p, preprocessed, rng, kernels) for p in parents_mut]
         
         # Combine offspring
         offspring = offspring_cx + offspring_mut
         
         # Replacement
         population, population_fitness = elitism_replacement_optimized(
-            population, population_fitness, offspring, 
-            df_clean, expected_sizes, PL, PP, popsize
+            population, population_fitness, offspring, popsize, evaluator
         )
         
         # Track best
-        best_fitness = population_fitness[0]
+        best_fitness = evaluator.best_score
         
         # Update best overall
         if best_fitness > best_overall_fitness:
             best_overall_fitness = best_fitness
-            best_overall_solution = population[0].copy()
+            stagnant_generations = 0
+        else:
+            stagnant_generations += 1
         
         # Check termination
-        if best_fitness >= target_fitness * max_fitness:
+        if best_fitness >= target_score:
             break
+        
+        # Partial restart saat stagnasi (adaptive mode)
+        stagnation_limit = adaptive_params['stagnation_limit']
+        if adaptive and stagnation_limit > 0 and stagnant_generations >= stagnation_limit:
+            population, population_fitness = partial_restart(
+                population, population_fitness, adaptive_params['restart_fraction'],
+                preprocessed, operators, evaluator, rng
+            )
+            stagnant_generations = 0
+            restarts += 1
     
     # Calculate execution time
     total_time = time.time() - start_time
     
     # Decode best solution
-    best_groups = decode_kromosom(best_overall_solution, df_clean, expected_sizes)
+    best_groups = decode_kromosom(operators.to_permutation(evaluator.best_individual, preprocessed),
+                                  df_clean, expected_sizes)
     
     # Prepare kelompok_list
     kelompok_list = []
@@ -395,22 +929,14 @@ def run_genetic_algorithm(data: List[Dict[str, Any]], parameters: Dict[str, Any]
     # Prepare kelompok_details
     kelompok_details = []
     for i, group_df in enumerate(best_groups, start=1):
-        c1 = evaluate_C1(group_df)
-        c2 = evaluate_C2(group_df)
-        c3 = evaluate_C3(group_df, PL, PP)
-        c4 = evaluate_C4(group_df, expected_sizes[i-1])
+        constraints = evaluate_group_constraints(group_df, PL, PP, expected_sizes[i-1])
         
         kelompok_details.append({
             'kelompok_id': i,
             'anggota': group_df['ID'].tolist(),
             'jumlah_anggota': len(group_df),
-            'constraints': {
-                'C1_HTQ': c1,
-                'C2_Heterogenitas_Jurusan': c2,
-                'C3_Proporsi_Gender': c3,
-                'C4_Jumlah_Anggota': c4
-            },
-            'score': c1 + c2 + c3 + c4
+            'constraints': constraints,
+            'score': sum(constraints.values())
         })
     
     # Prepare result
@@ -421,7 +947,18 @@ def run_genetic_algorithm(data: List[Dict[str, Any]], parameters: Dict[str, Any]
             'best_normalized_fitness': float(best_overall_fitness / max_fitness),
             'total_generations': generation,
             'execution_time_seconds': round(total_time, 2),
-            'max_fitness': int(max_fitness)
+            'max_fitness': int(max_fitness),
+            'upper_bound_fitness': int(upper_bound_fitness),
+            'backend': kernels.name,
+            'encoding': operators.name,
+            'fitness_mode': fitness_mode,
+            'best_graded_fitness': round(float(evaluator.best_fitness), 4) if fitness_mode == 'graded' else None,
+            'total_evaluations': evaluator.evaluations,
+            'cache_hits': evaluator.cache_hits,
+            'adaptive': adaptive,
+            'restarts': restarts,
+            'final_cr': round(float(cr), 4),
+            'final_mr': round(float(mr), 4)
         },
         'kelompok_details': kelompok_details
     }
@@ -0,0 +1,186 @@
+"""
+ga_kernels.py
+Kernel numerik untuk GA engine (fitness, PMX, swap mutation)
+
+Dua backend tersedia dengan output identik untuk seed yang sama:
+- numba : kernel nopython hasil JIT, di-cache ke disk (cache=True)
+- numpy : fallback murni NumPy jika numba tidak terpasang
+
+Semua angka acak diambil di ga_engine (bukan di kernel), sehingga kedua
+backend mengonsumsi stream RNG yang sama persis.
+"""
+
+import os
+from typing import Callable, Dict, NamedTuple, Optional
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - numba bersifat opsional
+    numba = None
+
+
+class KernelBackend(NamedTuple):
+    """Kumpulan kernel untuk satu backend"""
+    name: str
+    group_counts: Callable
+    pmx_child: Callable
+    swap_genes: Callable
+
+
+# ========================================
+# NUMPY BACKEND (FALLBACK)
+# ========================================
+
+def _group_counts_numpy(perm: np.ndarray, group_labels: np.ndarray, bounds: np.ndarray,
+                        htq: np.ndarray, gender: np.ndarray, major: np.ndarray,
+                        n_majors: int) -> tuple:
+    """Hitung (htq, jurusan unik, LK, PR) per kelompok secara vektor"""
+    K = len(bounds) - 1
+    htq_cnt = np.bincount(group_labels[htq[perm] == 1], minlength=K)
+    lk_cnt = np.bincount(group_labels[gender[perm] == 0], minlength=K)
+    pr_cnt = np.bincount(group_labels[gender[perm] == 1], minlength=K)
+
+    # Pasangan (kelompok, jurusan) unik -> jumlah jurusan berbeda per kelompok
+    keys = np.unique(group_labels * n_majors + major[perm])
+    distinct = np.bincount(keys // n_majors, minlength=K)
+
+    return htq_cnt, distinct, lk_cnt, pr_cnt
+
+
+def _pmx_child_numpy(p_self: np.ndarray, p_other: np.ndarray, start: int, end: int) -> np.ndarray:
+    """Bentuk satu anak PMX: segmen dari p_other, sisanya dari p_self + repair mapping"""
+    child = p_self.copy()
+    child[start:end] = p_other[start:end]
+
+    # Posisi tiap gen di segmen p_other (-1 jika bukan anggota segmen)
+    pos_in_segment = np.full(len(p_self), -1, dtype=np.int64)
+    pos_in_segment[p_other[start:end]] = np.arange(start, end)
+
+    outside = np.concatenate((np.arange(0, start), np.arange(end, len(child))))
+    conflicts = outside[pos_in_segment[child[outside]] >= 0]
+
+    # Jumlah konflik <= panjang segmen, ikuti rantai mapping untuk tiap konflik
+    for i in conflicts:
+        value = child[i]
+        while pos_in_segment[value] >= 0:
+            value = p_self[pos_in_segment[value]]
+        child[i] = value
+
+    return child
+
+
+def _swap_genes_numpy(parent: np.ndarray, idx1: int, idx2: int) -> np.ndarray:
+    """Tukar dua gen pada salinan parent"""
+    child = parent.copy()
+    child[idx1], child[idx2] = child[idx2], child[idx1]
+    return child
+
+
+# ========================================
+# NUMBA BACKEND
+# ========================================
+
+def _group_counts_loop(perm, group_labels, bounds, htq, gender, major, n_majors):
+    """Versi loop dari _group_counts_numpy untuk dikompilasi numba"""
+    K = len(bounds) - 1
+    htq_cnt = np.zeros(K, dtype=np.int64)
+    distinct = np.zeros(K, dtype=np.int64)
+    lk_cnt = np.zeros(K, dtype=np.int64)
+    pr_cnt = np.zeros(K, dtype=np.int64)
+    last_group = np.full(n_majors, -1, dtype=np.int64)
+
+    for g in range(K):
+        for pos in range(bounds[g], bounds[g + 1]):
+            idx = perm[pos]
+            if htq[idx] == 1:
+                htq_cnt[g] += 1
+            if gender[idx] == 0:
+                lk_cnt[g] += 1
+            elif gender[idx] == 1:
+                pr_cnt[g] += 1
+            m = major[idx]
+            if last_group[m] != g:
+                last_group[m] = g
+                distinct[g] += 1
+
+    return htq_cnt, distinct, lk_cnt, pr_cnt
+
+
+def _pmx_child_loop(p_self, p_other, start, end):
+    """Versi loop dari _pmx_child_numpy untuk dikompilasi numba"""
+    size = len(p_self)
+    child = p_self.copy()
+    pos_in_segment = np.full(size, -1, dtype=np.int64)
+    for j in range(start, end):
+        child[j] = p_other[j]
+        pos_in_segment[p_other[j]] = j
+
+    for i in range(size):
+        if start <= i < end:
+            continue
+        value = child[i]
+        while pos_in_segment[value] >= 0:
+            value = p_self[pos_in_segment[value]]
+        child[i] = value
+
+    return child
+
+
+def _swap_genes_loop(parent, idx1, idx2):
+    """Versi loop dari _swap_genes_numpy untuk dikompilasi numba"""
+    child = parent.copy()
+    tmp = child[idx1]
+    child[idx1] = child[idx2]
+    child[idx2] = tmp
+    return child
+
+
+# ========================================
+# BACKEND SELECTION
+# ========================================
+
+_BACKENDS: Dict[str, KernelBackend] = {
+    'numpy': KernelBackend('numpy', _group_counts_numpy, _pmx_child_numpy, _swap_genes_numpy),
+}
+
+if numba is not None:
+    _jit = numba.njit(cache=True, nogil=True)
+    _BACKENDS['numba'] = KernelBackend(
+        'numba',
+        _jit(_group_counts_loop),
+        _jit(_pmx_child_loop),
+        _jit(_swap_genes_loop),
+    )
+
+
+def available_backends() -> list:
+    """Daftar backend yang bisa dipakai di environment ini"""
+    return list(_BACKENDS.keys())
+
+
+def default_backend_name() -> str:
+    """
+    Backend default dari env GA_BACKEND=auto|numba|numpy (auto: numba jika tersedia).
+    Backend yang dipaksa tapi tidak tersedia (mis. numba belum terpasang) raise ValueError.
+    """
+    requested = os.getenv("GA_BACKEND", "auto").strip().lower()
+    if requested == 'auto':
+        return 'numba' if 'numba' in _BACKENDS else 'numpy'
+    if requested not in _BACKENDS:
+        raise ValueError(
+            f"GA_BACKEND='{requested}' tidak tersedia (tersedia: {available_backends()} atau 'auto')"
+        )
+    return requested
+
+
+def get_backend(name: Optional[str] = None) -> KernelBackend:
+    """
+    Ambil backend kernel berdasarkan nama.
+    Jika name None, gunakan default_backend_name() (numba jika terpasang).
+    """
+    name = name or default_backend_name()
+    if name not in _BACKENDS:
+        raise ValueError(f"Backend GA '{name}' tidak tersedia (tersedia: {available_backends()})")
+    return _BACKENDS[name]
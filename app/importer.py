@@ -0,0 +1,146 @@
+"""
+importer.py
+Streaming parser + validasi untuk bulk import data mahasiswa (CSV / NDJSON)
+
+Body request dibaca per chunk dan diproses per baris, sehingga pemakaian memori
+tidak bergantung pada ukuran file.
+"""
+
+import codecs
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from app.models import MahasiswaImportRow
+
+# Batas baris fisik untuk satu record CSV dengan field ber-quote multi-baris;
+# melebihi batas ini berarti quote tidak ditutup (mencegah buffer tumbuh tanpa batas)
+MAX_RECORD_LINES = 100
+
+# Kolom yang dikenali (case-insensitive) -> nama field MahasiswaImportRow
+COLUMN_ALIASES = {
+    'id': 'ID',
+    'jenis_kelamin': 'Jenis_Kelamin',
+    'jurusan': 'Jurusan',
+    'htq': 'HTQ',
+    'kohort': 'kohort',
+}
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """Pecah stream bytes menjadi (nomor_baris, teks) tanpa menampung seluruh body"""
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    buffer = ''
+    line_no = 0
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split('\n')
+        for line in lines:
+            line_no += 1
+            yield line_no, line.rstrip('\r')
+    buffer += decoder.decode(b'', final=True)
+    if buffer:
+        yield line_no + 1, buffer.rstrip('\r')
+
+
+def _normalize_keys(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Samakan nama kolom dan ubah nilai non-ID menjadi string seperti input CSV"""
+    normalized = {}
+    for key, value in record.items():
+        field = COLUMN_ALIASES.get(str(key).strip().lower())
+        if field is None or value is None or value == '':
+            continue
+        normalized[field] = value if field == 'ID' else str(value).strip()
+    return normalized
+
+
+def _quote_open(text: str) -> bool:
+    """True jika teks berakhir di dalam field ber-quote (record CSV belum lengkap)"""
+    # Cek murah dulu: jumlah quote genap tidak mungkin menyisakan field terbuka
+    if text.count('"') % 2 == 0:
+        return False
+    try:
+        list(csv.reader(io.StringIO(text), strict=True))
+    except csv.Error as e:
+        return 'unexpected end of data' in str(e)
+    return False
+
+
+async def iter_csv_records(lines: AsyncIterator[Tuple[int, str]]) -> AsyncIterator[Tuple[int, str]]:
+    """
+    Gabungkan baris fisik menjadi record CSV logis (RFC 4180): selama quote masih
+    terbuka, baris berikutnya adalah bagian dari field yang sama (newline dipertahankan).
+    Yield (nomor baris awal record, teks record). Record dengan quote yang tidak ditutup
+    dalam MAX_RECORD_LINES baris di-yield sebagai (nomor_baris, ValueError).
+    """
+    pending: List[str] = []
+    start_no = 0
+    async for line_no, line in lines:
+        if not pending:
+            start_no = line_no
+        pending.append(line)
+        text = '\n'.join(pending)
+        if _quote_open(text):
+            if len(pending) >= MAX_RECORD_LINES:
+                yield start_no, ValueError(f"Quote tidak ditutup dalam {MAX_RECORD_LINES} baris")
+                pending = []
+            continue
+        yield start_no, text
+        pending = []
+    if pending:
+        yield start_no, ValueError("Quote tidak ditutup sampai akhir file")
+
+
+async def iter_records(lines: AsyncIterator[Tuple[int, str]], fmt: str) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Ubah baris menjadi (nomor_baris, dict kolom) sesuai format.
+    Baris yang gagal di-parse di-yield sebagai (nomor_baris, Exception).
+    Untuk CSV, field ber-quote yang berisi newline digabung dulu oleh iter_csv_records.
+    """
+    header: Optional[List[str]] = None
+    source = lines if fmt == 'ndjson' else iter_csv_records(lines)
+    async for line_no, line in source:
+        if isinstance(line, Exception):
+            yield line_no, line
+            continue
+        if not line.strip():
+            continue
+        try:
+            if fmt == 'ndjson':
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("Baris NDJSON harus berupa object")
+            else:
+                values = next(csv.reader(io.StringIO(line)))
+                if header is None:
+                    header = values
+                    continue
+                if len(values) != len(header):
+                    raise ValueError(f"Jumlah kolom {len(values)} tidak sama dengan header ({len(header)})")
+                record = dict(zip(header, values))
+            yield line_no, _normalize_keys(record)
+        except (ValueError, csv.Error) as e:
+            yield line_no, e
+
+
+def validate_record(record: Dict[str, Any], default_kohort: Optional[str]) -> Dict[str, Any]:
+    """
+    Validasi satu baris dengan aturan MahasiswaData (validate_gender, validate_htq)
+    dan kembalikan dict kolom tabel data. Raise ValueError jika tidak valid.
+    """
+    if default_kohort is not None:
+        record = {**record, 'kohort': default_kohort}
+    try:
+        row = MahasiswaImportRow(**record)
+    except ValidationError as e:
+        raise ValueError("; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()))
+    return {
+        'id': row.ID,
+        'jenis_kelamin': row.Jenis_Kelamin,
+        'jurusan': row.Jurusan,
+        'htq': row.HTQ,
+        'kohort': row.kohort,
+    }
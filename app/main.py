@@ -3,20 +3,39 @@ main.py
 FastAPI application - REST API endpoints
 """
 
-from typing import Dict, Any
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
+import asyncio
+import hashlib
+import json
+import os
+import time
+from datetime import timedelta
+from typing import Dict, Any, Optional
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from sqlalchemy import and_, delete, func, insert, or_, select, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import (
+    CohortFilter,
+    ImportResponse,
+    ImportRowError,
     OptimizationRequest,
     OptimizationResponse,
-    OptimizationResult
+    OptimizationResult,
+    PrecheckResponse,
+    ProfileResponse
 )
-from app.ga_engine import run_genetic_algorithm
-from database.database import get_db, engine
-from database.models import Base, Data, Optimasi, Kelompok
+from app.ga_engine import run_genetic_algorithm, precheck_feasibility
+from app.importer import iter_lines, iter_records, validate_record
+from app.exporter import MEDIA_TYPES, stream_export
+from app.profiling import JobProfiler, job_finished, job_started
+from app import metrics
+from database.database import get_async_db, engine, async_engine
+from database.migrations import upgrade_schema
+from database.models import Base, Data, Optimasi, Kelompok, get_jakarta_time
 
 
 # ========================================
@@ -26,6 +45,28 @@ from database.models import Base, Data, Optimasi, Kelompok
 # Create database tables
 Base.metadata.create_all(bind=engine)
 
+# Tambah kolom/index baru ke tabel yang sudah ada (create_all tidak mengubah tabel lama)
+upgrade_schema(engine)
+
+
+def fail_orphaned_jobs() -> int:
+    """
+    Tandai job pending/processing dari proses sebelumnya sebagai failed.
+    Job berjalan di BackgroundTasks yang tidak bertahan restart/crash, sehingga job
+    tersebut tidak akan pernah selesai dan tidak boleh lagi dipakai deduplikasi.
+    Returns jumlah job yang ditandai failed.
+    """
+    with engine.begin() as conn:
+        result = conn.execute(
+            update(Optimasi)
+            .where(Optimasi.status.in_(["pending", "processing"]))
+            .values(status="failed", updated_at=get_jakarta_time())
+        )
+    return result.rowcount
+
+
+fail_orphaned_jobs()
+
 app = FastAPI(
     title="GA KKM Optimization API",
     description="REST API untuk optimasi penentuan kelompok KKM menggunakan Algoritma Genetika",
@@ -41,6 +82,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Connection pool gauges untuk /metrics
+metrics.register_pool_metrics({"sync": engine, "async": async_engine})
+
 
 # ========================================
 # IN-MEMORY JOB STORAGE
@@ -49,18 +93,115 @@ app.add_middleware(
 # Tidak diperlukan lagi - semua data disimpan di database
 
 
+# ========================================
+# DATA LOADING
+# ========================================
+
+async def load_data_list(db: AsyncSession, jumlah_kelompok: int, cohort: Optional[CohortFilter] = None) -> list:
+    """
+    Ambil data mahasiswa dari database dalam format GA engine.
+    Filter kohort dijalankan di SQL (kolom terindeks) dan hanya kolom yang
+    dipakai GA yang di-load.
+    Raise HTTPException 400 jika data kosong atau kurang dari jumlah kelompok.
+    """
+    query = select(Data.id, Data.jenis_kelamin, Data.jurusan, Data.htq)
+    if cohort is not None:
+        if cohort.kohort is not None:
+            query = query.where(Data.kohort == cohort.kohort)
+        if cohort.jurusan:
+            query = query.where(Data.jurusan.in_(cohort.jurusan))
+        if cohort.ids:
+            query = query.where(Data.id.in_(cohort.ids))
+    rows = (await db.execute(query.order_by(Data.id))).all()
+    
+    if len(rows) == 0:
+        raise HTTPException(status_code=400, detail="Tidak ada data mahasiswa di database untuk kohort ini")
+    
+    # Convert to dict for GA engine (format sama dengan Data.to_dict)
+    data_list = [
+        {"ID": row.id, "Jenis_Kelamin": row.jenis_kelamin, "Jurusan": row.jurusan, "HTQ": row.htq}
+        for row in rows
+    ]
+    
+    # Validation
+    if len(data_list) < jumlah_kelompok:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Jumlah mahasiswa ({len(data_list)}) harus >= jumlah kelompok ({jumlah_kelompok})"
+        )
+    
+    return data_list
+
+
+# ========================================
+# REQUEST DEDUPLICATION
+# ========================================
+
+# Submission identik (data + parameter sama) memakai hasil job completed dalam TTL ini
+OPTIMIZE_DEDUP_TTL = int(os.getenv("OPTIMIZE_DEDUP_TTL", "3600"))
+
+# Job pending/processing yang tidak berubah status selama ini dianggap macet (worker crash)
+OPTIMIZE_STALE_AFTER = int(os.getenv("OPTIMIZE_STALE_AFTER", "86400"))
+
+# Serialisasi cek + insert agar double-submit bersamaan tidak membuat dua job
+_submit_lock = asyncio.Lock()
+
+
+def compute_fingerprint(data_list: list, parameters: dict) -> str:
+    """
+    Fingerprint job: hash isi data kohort (versi dataset) + parameter GA (termasuk seed).
+    Perubahan satu baris data atau satu parameter menghasilkan fingerprint berbeda.
+    """
+    data_hash = hashlib.sha256()
+    for row in data_list:
+        data_hash.update(f"{row['ID']}|{row['Jenis_Kelamin']}|{row['Jurusan']}|{row['HTQ']}\n".encode())
+    payload = json.dumps({"data": data_hash.hexdigest(), "parameters": parameters}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+async def find_duplicate_job(db: AsyncSession, fingerprint: str) -> Optional[Optimasi]:
+    """
+    Cari job dengan fingerprint sama:
+    - pending/processing, berapapun lamanya berjalan, selama belum melewati OPTIMIZE_STALE_AFTER
+    - completed dalam OPTIMIZE_DEDUP_TTL terakhir
+    """
+    if OPTIMIZE_DEDUP_TTL <= 0:
+        return None
+    now = get_jakarta_time()
+    completed_cutoff = now - timedelta(seconds=OPTIMIZE_DEDUP_TTL)
+    stale_cutoff = now - timedelta(seconds=OPTIMIZE_STALE_AFTER)
+    query = (
+        select(Optimasi)
+        .where(Optimasi.fingerprint == fingerprint)
+        .where(or_(
+            and_(Optimasi.status.in_(["pending", "processing"]), Optimasi.updated_at >= stale_cutoff),
+            and_(Optimasi.status == "completed", Optimasi.updated_at >= completed_cutoff)
+        ))
+        .order_by(Optimasi.id.desc())
+        .limit(1)
+    )
+    return (await db.execute(query)).scalars().first()
+
+
 # ========================================
 # BACKGROUND TASK - PROCESS OPTIMIZATION
 # ========================================
 
-async def process_optimization(optimasi_id: int, data: list, parameters: dict):
+def process_optimization(optimasi_id: int, data: list, parameters: dict, profile: bool = False):
     """
     Background task untuk menjalankan algoritma genetika
+    Sengaja sync (def) agar dijalankan di threadpool dan tidak memblokir event loop
+    Jika profile=True, GA dan penyimpanan hasil dijalankan di bawah cProfile dan
+    ringkasannya disimpan ke record optimasi (juga untuk job yang gagal)
     """
     from database.database import SessionLocal
     from database.models import Optimasi, Kelompok
-    import time
     db = SessionLocal()
+    optimasi = None
+    profiler = JobProfiler() if profile else None
+    metrics.JOBS_QUEUED.dec()
+    metrics.JOBS_RUNNING.inc()
+    job_started()
     
     try:
         # Get optimasi record
@@ -72,6 +213,9 @@ async def process_optimization(optimasi_id: int, data: list, parameters: dict):
         optimasi.status = "processing"
         db.commit()
         
+        if profiler:
+            profiler.start()
+        
         # Record start time
         start_time = time.time()
         
@@ -79,9 +223,12 @@ async def process_optimization(optimasi_id: int, data: list, parameters: dict):
         result = run_genetic_algorithm(data, parameters)
         
         # Calculate execution time
-        execution_time = int(time.time() - start_time)
+        ga_seconds = time.time() - start_time
+        execution_time = int(ga_seconds)
+        record_ga_metrics(result["statistics"], ga_seconds)
         
         # Save results to database
+        save_start = time.time()
         kelompok_list = result["kelompok_list"]
         for kelompok_idx, anggota_ids in enumerate(kelompok_list):
             for mahasiswa_id in anggota_ids:
@@ -96,18 +243,56 @@ async def process_optimization(optimasi_id: int, data: list, parameters: dict):
         optimasi.status = "completed"
         optimasi.fitness_terbaik = result["statistics"]["best_normalized_fitness"]
         optimasi.waktu_eksekusi = execution_time
+        optimasi.jumlah_evaluasi = result["statistics"]["total_evaluations"]
         db.commit()
+        save_seconds = time.time() - save_start
+        metrics.STAGE_SECONDS.observe(save_seconds, stage="save_results")
+        metrics.JOBS_TOTAL.inc(status="completed")
+        
+        if profiler:
+            profiler.stop()
+            profiler.add_stage("ga", ga_seconds)
+            profiler.add_stage("save_results", save_seconds)
+            save_profile(db, optimasi, profiler)
         
     except Exception as e:
         # Handle error
         if optimasi:
+            db.rollback()
             optimasi.status = "failed"
             db.commit()
+            if profiler:
+                profiler.stop()
+                save_profile(db, optimasi, profiler)
+        metrics.JOBS_TOTAL.inc(status="failed")
         raise
     finally:
+        if profiler:
+            profiler.stop()
+        job_finished()
+        metrics.JOBS_RUNNING.dec()
         db.close()
 
 
+def save_profile(db, optimasi, profiler: JobProfiler):
+    """Simpan ringkasan profil (JSON) dan dump pstats ke record optimasi"""
+    optimasi.profil = json.dumps(profiler.summary())
+    optimasi.profil_pstats = profiler.pstats_blob()
+    db.commit()
+
+
+def record_ga_metrics(statistics: dict, ga_seconds: float):
+    """Catat statistik run GA ke metrics registry"""
+    evaluations = statistics["total_evaluations"]
+    metrics.STAGE_SECONDS.observe(ga_seconds, stage="ga")
+    metrics.GA_EVALUATIONS.inc(evaluations)
+    metrics.GA_SECONDS.inc(ga_seconds)
+    if ga_seconds > 0:
+        metrics.GA_EVALUATIONS_PER_SECOND.set(evaluations / ga_seconds)
+    metrics.FITNESS_CACHE_LOOKUPS.inc(evaluations + statistics["cache_hits"])
+    metrics.FITNESS_CACHE_HITS.inc(statistics["cache_hits"])
+
+
 # ========================================
 # REST API ENDPOINT
 # ========================================
@@ -120,62 +305,83 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "optimize": "POST /api/optimize",
-            "health": "GET /health"
+            "precheck": "POST /api/optimize/precheck",
+            "export": "GET /api/optimize/{id}/export",
+            "profile": "GET /api/optimize/{id}/profile",
+            "import": "POST /api/data/import",
+            "health": "GET /health",
+            "metrics": "GET /metrics"
         }
     }
 
 
+async def create_optimasi_record(db: AsyncSession, request: OptimizationRequest, fingerprint: str) -> Optimasi:
+    """Buat record optimasi berstatus pending"""
+    optimasi = Optimasi(
+        status="pending",
+        popsize=request.parameters.popsize,
+        generation=request.parameters.generation,
+        cr=float(request.parameters.cr),
+        mr=float(request.parameters.mr),
+        kriteria_penghentian=float(request.parameters.kriteria_penghentian),
+        jumlah_kelompok=request.parameters.jumlah_kelompok,
+        encoding=request.parameters.encoding,
+        fitness_mode=request.parameters.fitness_mode,
+        kohort=request.cohort.cohort_key() if request.cohort else None,
+        fingerprint=fingerprint
+    )
+    db.add(optimasi)
+    await db.commit()
+    await db.refresh(optimasi)
+    return optimasi
+
+
 @app.post("/api/optimize", response_model=OptimizationResponse)
 async def create_optimization_job(
     request: OptimizationRequest,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Endpoint untuk membuat optimization job
     
     - Mengambil data mahasiswa dari database
     - Validasi data
+    - Memakai ulang job identik yang sedang berjalan / baru selesai (kecuali force=true / profile=true)
     - Membuat record optimasi
     - Menjalankan background task
     - Return status berhasil
     """
     try:
         # Fetch all data from database
-        mahasiswa_list = db.query(Data).all()
-        
-        if len(mahasiswa_list) == 0:
-            raise HTTPException(status_code=400, detail="Tidak ada data mahasiswa di database")
-        
-        # Convert to dict for GA engine
-        data_list = [m.to_dict() for m in mahasiswa_list]
-        
-        # Validation
-        if len(data_list) < request.parameters.jumlah_kelompok:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Jumlah mahasiswa ({len(data_list)}) harus >= jumlah kelompok ({request.parameters.jumlah_kelompok})"
-            )
-        
-        # Create optimasi record
-        optimasi = Optimasi(
-            status="pending",
-            popsize=request.parameters.popsize,
-            generation=request.parameters.generation,
-            cr=float(request.parameters.cr),
-            mr=float(request.parameters.mr),
-            kriteria_penghentian=float(request.parameters.kriteria_penghentian),
-            jumlah_kelompok=request.parameters.jumlah_kelompok
-        )
-        db.add(optimasi)
-        db.commit()
-        db.refresh(optimasi)
+        load_start = time.time()
+        data_list = await load_data_list(db, request.parameters.jumlah_kelompok, request.cohort)
+        metrics.STAGE_SECONDS.observe(time.time() - load_start, stage="load_data")
         
         # Convert parameters to dict
         parameters_dict = request.parameters.model_dump()
+        fingerprint = await run_in_threadpool(compute_fingerprint, data_list, parameters_dict)
+        
+        async with _submit_lock:
+            # Deduplicate submission identik (job profiling selalu dijalankan ulang)
+            if not request.force and not request.profile:
+                existing = await find_duplicate_job(db, fingerprint)
+                if existing is not None:
+                    metrics.JOBS_DEDUPLICATED.inc(status=existing.status)
+                    return OptimizationResponse(
+                        id_optimasi=existing.id,
+                        status="success",
+                        message=f"Optimasi identik sudah ada (status: {existing.status}), hasil dipakai ulang",
+                        deduplicated=True
+                    )
+            
+            # Create optimasi record
+            optimasi = await create_optimasi_record(db, request, fingerprint)
         
         # Add background task
-        background_tasks.add_task(process_optimization, optimasi.id, data_list, parameters_dict)
+        background_tasks.add_task(process_optimization, optimasi.id, data_list, parameters_dict, request.profile)
+        metrics.JOBS_QUEUED.inc()
+        metrics.JOBS_TOTAL.inc(status="submitted")
         
         # Return response
         return OptimizationResponse(
@@ -190,27 +396,302 @@ async def create_optimization_job(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@app.post("/api/optimize/precheck", response_model=PrecheckResponse)
+async def precheck_optimization(
+    request: OptimizationRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Endpoint untuk mengecek kelayakan target sebelum optimasi dijalankan
+    
+    - Menghitung upper bound fitness per constraint dari komposisi data
+    - Mengembalikan target efektif (kriteria_penghentian dibatasi upper bound)
+    """
+    try:
+        data_list = await load_data_list(db, request.parameters.jumlah_kelompok, request.cohort)
+        precheck = await run_in_threadpool(precheck_feasibility, data_list, request.parameters.model_dump())
+        return PrecheckResponse(**precheck)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+# ========================================
+# RESULT EXPORT ENDPOINT
+# ========================================
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+
+@app.get("/api/optimize/{id_optimasi}/export")
+async def export_optimization(
+    id_optimasi: int,
+    fmt: str = Query("csv", alias="format", pattern="^(csv|ndjson)$", description="csv atau ndjson"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Endpoint untuk export hasil pengelompokan (streaming)
+    
+    - Satu baris per mahasiswa: kelompok, ID, jenis kelamin, jurusan, HTQ
+    - Ditambah skor constraint C1-C4 dan score kelompoknya
+    - Baris dibaca dari server-side cursor, byte pertama dikirim sebelum query selesai
+    """
+    optimasi = await db.get(Optimasi, id_optimasi)
+    if optimasi is None:
+        raise HTTPException(status_code=404, detail=f"Optimasi {id_optimasi} tidak ditemukan")
+    if optimasi.status != "completed":
+        raise HTTPException(
+            status_code=409,
+            detail=f"Optimasi {id_optimasi} belum selesai (status: {optimasi.status})"
+        )
+    
+    # PL/PP dan N dihitung dari seluruh anggota hasil optimasi (sama seperti preprocess_data)
+    result = await db.execute(
+        select(Data.jenis_kelamin, func.count())
+        .select_from(Kelompok)
+        .join(Data, Kelompok.id_data == Data.id)
+        .where(Kelompok.id_optimasi == id_optimasi)
+        .group_by(Data.jenis_kelamin)
+    )
+    gender_counts = dict(result.all())
+    N = sum(gender_counts.values())
+    if N == 0:
+        raise HTTPException(status_code=404, detail=f"Optimasi {id_optimasi} tidak memiliki data kelompok")
+    PL = gender_counts.get("LK", 0) / N
+    PP = gender_counts.get("PR", 0) / N
+    
+    return StreamingResponse(
+        stream_export(id_optimasi, fmt, optimasi.jumlah_kelompok, N, PL, PP, EXPORT_BATCH_SIZE),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="optimasi_{id_optimasi}.{fmt}"'}
+    )
+
+
+# ========================================
+# JOB PROFILE ENDPOINT
+# ========================================
+
+@app.get("/api/optimize/{id_optimasi}/profile", response_model=ProfileResponse)
+async def get_optimization_profile(
+    id_optimasi: int,
+    fmt: str = Query("json", alias="format", pattern="^(json|pstats)$", description="json atau pstats"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Endpoint untuk mengambil profil job optimasi yang dijalankan dengan profile=true
+    
+    - format=json: ringkasan durasi per tahap dan top fungsi berdasarkan cumulative time
+    - format=pstats: dump pstats mentah, buka dengan pstats.Stats(path) / snakeviz
+    """
+    optimasi = await db.get(Optimasi, id_optimasi)
+    if optimasi is None:
+        raise HTTPException(status_code=404, detail=f"Optimasi {id_optimasi} tidak ditemukan")
+    if optimasi.profil is None:
+        if optimasi.status in ("pending", "processing"):
+            raise HTTPException(
+                status_code=409,
+                detail=f"Optimasi {id_optimasi} belum selesai (status: {optimasi.status})"
+            )
+        raise HTTPException(status_code=404, detail=f"Optimasi {id_optimasi} tidak dijalankan dengan profile=true")
+    
+    if fmt == "pstats":
+        blob = (await db.execute(
+            select(Optimasi.profil_pstats).where(Optimasi.id == id_optimasi)
+        )).scalar_one()
+        if blob is None:
+            raise HTTPException(status_code=404, detail=f"Optimasi {id_optimasi} tidak memiliki dump pstats")
+        return Response(
+            content=blob,
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="optimasi_{id_optimasi}.pstats"'}
+        )
+    
+    return ProfileResponse(id_optimasi=optimasi.id, status=optimasi.status, **json.loads(optimasi.profil))
+
+
+# ========================================
+# DATA IMPORT ENDPOINT
+# ========================================
+
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+MAX_REPORTED_ERRORS = 100
+
+
+@app.post("/api/data/import", response_model=ImportResponse)
+async def import_data(
+    request: Request,
+    fmt: Optional[str] = Query(None, alias="format", pattern="^(csv|ndjson)$",
+                               description="csv atau ndjson (default dari Content-Type)"),
+    kohort: Optional[str] = Query(None, max_length=50, description="Tag kohort untuk semua baris"),
+    replace: bool = Query(False, description="Ganti seluruh data kohort secara atomik"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Endpoint untuk bulk import data mahasiswa dari body CSV / NDJSON (streaming)
+    
+    - Body dibaca per chunk, divalidasi per baris (aturan sama dengan MahasiswaData)
+    - Baris valid di-insert per batch (executemany), baris invalid dilaporkan tanpa membatalkan import
+    - ID yang sudah ada di database atau muncul dua kali di file dilaporkan sebagai error baris
+    - replace=true menghapus data kohort lama dan meng-insert data baru dalam satu transaksi;
+      ditolak jika data kohort sudah dipakai hasil optimasi (kelompoks mereferensikan data)
+    """
+    if fmt is None:
+        content_type = request.headers.get("content-type", "")
+        fmt = "ndjson" if "json" in content_type else "csv"
+    if replace and kohort is None:
+        raise HTTPException(status_code=400, detail="Parameter kohort wajib diisi jika replace=true")
+    
+    import_start = time.time()
+    total_rows = inserted = failed = deleted = 0
+    errors = []
+    batch = []
+    seen_ids = set()
+    
+    def add_error(line_no: int, error: str):
+        nonlocal failed
+        failed += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append(ImportRowError(line=line_no, error=error))
+    
+    async def insert_batch(batch: list) -> int:
+        """Insert satu batch (line_no, row); baris dengan ID yang sudah dipakai menjadi error baris"""
+        ids = [row['id'] for _, row in batch if row['id'] is not None]
+        existing = set()
+        if ids:
+            existing = set((await db.execute(select(Data.id).where(Data.id.in_(ids)))).scalars())
+        rows = []
+        for line_no, row in batch:
+            row_id = row['id']
+            if row_id is not None:
+                if row_id in existing:
+                    add_error(line_no, f"ID {row_id} sudah ada di database")
+                    continue
+                if row_id in seen_ids:
+                    add_error(line_no, f"ID {row_id} duplikat di dalam file import")
+                    continue
+                seen_ids.add(row_id)
+            rows.append(row)
+        if rows:
+            await db.execute(insert(Data), rows)
+        return len(rows)
+    
+    try:
+        # Replace kohort: delete + insert dalam satu transaksi
+        if replace:
+            used_by = (await db.execute(
+                select(Kelompok.id_optimasi)
+                .join(Data, Kelompok.id_data == Data.id)
+                .where(Data.kohort == kohort)
+                .distinct()
+                .order_by(Kelompok.id_optimasi)
+            )).scalars().all()
+            if used_by:
+                raise HTTPException(
+                    status_code=409,
+                    detail=(
+                        f"Kohort '{kohort}' tidak bisa diganti karena datanya dipakai hasil optimasi "
+                        f"(id_optimasi: {', '.join(map(str, used_by))}); import ke kohort baru"
+                    )
+                )
+            result = await db.execute(delete(Data).where(Data.kohort == kohort))
+            deleted = result.rowcount
+        
+        async for line_no, record in iter_records(iter_lines(request.stream()), fmt):
+            total_rows += 1
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                batch.append((line_no, validate_record(record, kohort)))
+            except Exception as e:
+                add_error(line_no, str(e))
+                continue
+            
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                inserted += await insert_batch(batch)
+                batch = []
+        
+        if batch:
+            inserted += await insert_batch(batch)
+        
+        await db.commit()
+        metrics.STAGE_SECONDS.observe(time.time() - import_start, stage="import")
+        
+        return ImportResponse(
+            total_rows=total_rows,
+            inserted=inserted,
+            failed=failed,
+            deleted=deleted,
+            errors=errors,
+            errors_truncated=failed > len(errors)
+        )
+        
+    except IntegrityError as e:
+        # ID duplikat sudah dicek per batch; sisa konflik berasal dari import lain yang berjalan bersamaan
+        await db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail=f"Import dibatalkan, konflik data dengan perubahan lain yang berjalan bersamaan: {e.orig}"
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
 # ========================================
 # HEALTH CHECK ENDPOINT
 # ========================================
 
+# Hasil cek database di-cache agar probe load balancer tidak selalu query ke DB
+HEALTH_CACHE_TTL = float(os.getenv("HEALTH_CACHE_TTL", "10"))
+_health_cache: Dict[str, Any] = {"checked_at": None, "result": None}
+
+
 @app.get("/health")
-async def health_check(db: Session = Depends(get_db)):
-    """Health check endpoint"""
+async def health_check():
+    """
+    Health check endpoint (liveness + readiness database)
+    Hasil sehat di-cache HEALTH_CACHE_TTL detik; kegagalan tidak di-cache dan
+    dikembalikan dengan status 503 agar probe load balancer menandai node tidak siap.
+    """
+    now = time.monotonic()
+    checked_at = _health_cache["checked_at"]
+    if checked_at is not None and now - checked_at < HEALTH_CACHE_TTL:
+        return _health_cache["result"]
+    
     try:
         # Test database connection
-        total_data = db.query(Data).count()
-        total_optimasi = db.query(Optimasi).count()
-        
-        return {
-            "status": "healthy",
-            "database": "connected",
-            "total_mahasiswa": total_data,
-            "total_optimasi": total_optimasi
-        }
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
     except Exception as e:
-        return {
-            "status": "unhealthy",
-            "database": "disconnected",
-            "error": str(e)
-        }
+        _health_cache["checked_at"] = None
+        _health_cache["result"] = None
+        return JSONResponse(
+            status_code=503,
+            content={
+                "status": "unhealthy",
+                "database": "disconnected",
+                "error": str(e)
+            }
+        )
+    
+    result = {
+        "status": "healthy",
+        "database": "connected"
+    }
+    _health_cache["checked_at"] = now
+    _health_cache["result"] = result
+    return result
+
+
+# ========================================
+# METRICS ENDPOINT
+# ========================================
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """Metrics dalam format Prometheus text exposition"""
+    return PlainTextResponse(metrics.REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
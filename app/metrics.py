@@ -0,0 +1,230 @@
+"""
+metrics.py
+In-process metrics registry dengan output format Prometheus (text exposition 0.0.4)
+
+Tidak butuh service eksternal: counter/gauge/histogram disimpan di memori
+proses dan di-render oleh endpoint GET /metrics.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labelnames: Tuple[str, ...], labelvalues: LabelValues, extra: Optional[Dict[str, str]] = None) -> str:
+    """Format label ke {a="x",b="y"} (kosong jika tidak ada label)"""
+    pairs = list(zip(labelnames, labelvalues)) + list((extra or {}).items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric(ABC):
+    """Base class metric dengan label"""
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Metric {self.name} butuh label {self.labelnames}, bukan {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def samples(self) -> List[Tuple[str, str, float]]:
+        """List (nama sample, label terformat, nilai) untuk render"""
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for sample_name, labels, value in self.samples():
+            lines.append(f"{sample_name}{labels} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Counter yang hanya bisa naik"""
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counter hanya bisa bertambah")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            items = list(self._values.items())
+        if not items and not self.labelnames:
+            items = [((), 0.0)]
+        return [(self.name, _format_labels(self.labelnames, key), value) for key, value in items]
+
+
+class Gauge(_Metric):
+    """Gauge yang bisa naik/turun, atau dibaca dari callback saat render"""
+    type_name = "gauge"
+
+    def __init__(self, *args, callback: Optional[Callable[[], Dict[LabelValues, float]]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback = callback
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        if self._callback is not None:
+            items = list(self._callback().items())
+        else:
+            with self._lock:
+                items = list(self._values.items())
+            if not items and not self.labelnames:
+                items = [((), 0.0)]
+        return [(self.name, _format_labels(self.labelnames, key), value) for key, value in items]
+
+
+class Histogram(_Metric):
+    """Histogram dengan bucket kumulatif (le), _sum dan _count"""
+    type_name = "histogram"
+
+    def __init__(self, *args, buckets: Iterable[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._values: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            items = [(key, (list(counts), total, count)) for key, (counts, total, count) in self._values.items()]
+        samples = []
+        for key, (counts, total, count) in items:
+            for bound, bucket_count in zip(self.buckets, counts):
+                labels = _format_labels(self.labelnames, key, {"le": _format_value(bound)})
+                samples.append((f"{self.name}_bucket", labels, bucket_count))
+            samples.append((f"{self.name}_sum", _format_labels(self.labelnames, key), total))
+            samples.append((f"{self.name}_count", _format_labels(self.labelnames, key), count))
+        return samples
+
+
+class MetricsRegistry:
+    """Kumpulan metric yang di-render bersama oleh /metrics"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} sudah terdaftar")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+              callback: Optional[Callable[[], Dict[LabelValues, float]]] = None) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, callback=callback))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets=buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+# ========================================
+# GLOBAL REGISTRY & METRICS
+# ========================================
+
+REGISTRY = MetricsRegistry()
+
+JOBS_QUEUED = REGISTRY.gauge("ga_jobs_queued", "Job optimasi yang menunggu dijalankan (queue depth)")
+JOBS_RUNNING = REGISTRY.gauge("ga_jobs_running", "Job optimasi yang sedang berjalan")
+JOBS_TOTAL = REGISTRY.counter(
+    "ga_jobs_total", "Jumlah job optimasi per hasil (submitted saat dibuat, completed/failed saat selesai)", ["status"]
+)
+JOBS_DEDUPLICATED = REGISTRY.counter(
+    "ga_jobs_deduplicated_total", "Submission yang dijawab dari job identik, per status job tersebut", ["status"]
+)
+
+GA_EVALUATIONS = REGISTRY.counter("ga_fitness_evaluations_total", "Jumlah evaluasi fitness (di luar cache hit)")
+GA_SECONDS = REGISTRY.counter("ga_run_seconds_total", "Total waktu eksekusi GA (detik)")
+GA_EVALUATIONS_PER_SECOND = REGISTRY.gauge(
+    "ga_evaluations_per_second", "Evaluasi fitness per detik pada run GA terakhir"
+)
+FITNESS_CACHE_LOOKUPS = REGISTRY.counter("ga_fitness_cache_lookups_total", "Jumlah lookup cache fitness")
+FITNESS_CACHE_HITS = REGISTRY.counter("ga_fitness_cache_hits_total", "Jumlah cache hit fitness")
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "ga_stage_duration_seconds", "Durasi tiap tahap job optimasi (detik)", ["stage"]
+)
+
+
+def register_pool_metrics(engines: Dict[str, object]) -> None:
+    """Daftarkan gauge pemakaian connection pool untuk engine SQLAlchemy (sync/async)"""
+
+    def pool_stat(method: str) -> Callable[[], Dict[LabelValues, float]]:
+        def collect() -> Dict[LabelValues, float]:
+            values = {}
+            for engine_name, engine in engines.items():
+                stat = getattr(engine.pool, method, None)
+                if callable(stat):
+                    # QueuePool.overflow() negatif selama pool belum penuh
+                    values[(engine_name,)] = max(float(stat()), 0.0) if method == "overflow" else float(stat())
+            return values
+        return collect
+
+    REGISTRY.gauge("db_pool_size", "Ukuran connection pool", ["engine"], callback=pool_stat("size"))
+    REGISTRY.gauge("db_pool_checked_out", "Koneksi yang sedang dipakai", ["engine"], callback=pool_stat("checkedout"))
+    REGISTRY.gauge("db_pool_overflow", "Koneksi overflow di atas pool_size", ["engine"], callback=pool_stat("overflow"))
@@ -3,8 +3,19 @@ models.py
 Pydantic data models untuk request/response validation
 """
 
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional, Dict, Any
+import hashlib
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import List, Optional, Dict, Any, Literal
+
+from app.ga_engine import ADAPTIVE_DEFAULTS
+
+
+class ConstraintWeights(BaseModel):
+    """Model untuk bobot tiap constraint pada fitness_mode graded"""
+    C1_HTQ: float = Field(1.0, ge=0.0, description="Bobot constraint HTQ")
+    C2_Heterogenitas_Jurusan: float = Field(1.0, ge=0.0, description="Bobot constraint heterogenitas jurusan")
+    C3_Proporsi_Gender: float = Field(1.0, ge=0.0, description="Bobot constraint proporsi gender")
+    C4_Jumlah_Anggota: float = Field(1.0, ge=0.0, description="Bobot constraint jumlah anggota")
 
 
 class GAParameters(BaseModel):
@@ -15,6 +26,42 @@ class GAParameters(BaseModel):
     mr: float = Field(..., ge=0.0, le=1.0, description="Mutation rate (0.0-1.0)")
     kriteria_penghentian: float = Field(..., ge=0.0, le=1.0, description="Target fitness untuk penghentian (0.0-1.0)")
     jumlah_kelompok: int = Field(..., gt=0, description="Jumlah kelompok KKM yang diinginkan")
+    seed: Optional[int] = Field(None, ge=0, description="Seed random opsional agar hasil bisa direproduksi")
+    encoding: Literal['permutation', 'group'] = Field(
+        'permutation',
+        description="Encoding + operator: permutation (PMX + reciprocal exchange) atau group (label vector + group injection/swap)"
+    )
+    adaptive: bool = Field(False, description="Atur cr/mr otomatis berdasarkan diversity populasi")
+    cr_min: Optional[float] = Field(None, ge=0.0, le=1.0, description="Batas bawah cr pada mode adaptive (default 0.3)")
+    cr_max: Optional[float] = Field(None, ge=0.0, le=1.0, description="Batas atas cr pada mode adaptive (default 0.9)")
+    mr_min: Optional[float] = Field(None, ge=0.0, le=1.0, description="Batas bawah mr pada mode adaptive (default 0.1)")
+    mr_max: Optional[float] = Field(None, ge=0.0, le=1.0, description="Batas atas mr pada mode adaptive (default 0.7)")
+    stagnation_limit: Optional[int] = Field(
+        None, ge=0, description="Partial restart setelah N generasi tanpa perbaikan (0/None = nonaktif)"
+    )
+    restart_fraction: Optional[float] = Field(
+        None, gt=0.0, lt=1.0, description="Proporsi individu terburuk yang diganti saat restart (default 0.5)"
+    )
+    fitness_mode: Literal['binary', 'graded'] = Field(
+        'binary',
+        description="Fitness seleksi: binary (jumlah constraint terpenuhi) atau graded (soft penalty jarak ke pemenuhan)"
+    )
+    constraint_weights: Optional[ConstraintWeights] = Field(
+        None, description="Bobot per constraint untuk fitness_mode graded (default semua 1.0)"
+    )
+
+    @model_validator(mode='after')
+    def validate_rate_bounds(self) -> 'GAParameters':
+        """Validasi batas rate adaptive: min <= max (batas yang kosong memakai ADAPTIVE_DEFAULTS)"""
+        for low, high in (('cr_min', 'cr_max'), ('mr_min', 'mr_max')):
+            low_value, high_value = getattr(self, low), getattr(self, high)
+            if low_value is None and high_value is None:
+                continue
+            low_value = ADAPTIVE_DEFAULTS[low] if low_value is None else low_value
+            high_value = ADAPTIVE_DEFAULTS[high] if high_value is None else high_value
+            if low_value > high_value:
+                raise ValueError(f"{low} ({low_value}) harus <= {high} ({high_value})")
+        return self
 
     class Config:
         json_schema_extra = {
@@ -76,9 +123,83 @@ class MahasiswaData(BaseModel):
         }
 
 
+class MahasiswaImportRow(MahasiswaData):
+    """Model untuk satu baris bulk import (ID opsional, auto increment jika kosong)"""
+    ID: Optional[int] = Field(None, gt=0, description="ID mahasiswa (opsional)")
+    Jurusan: str = Field(..., min_length=1, max_length=100, description="Nama jurusan mahasiswa")
+    kohort: Optional[str] = Field(None, max_length=50, description="Tag kohort")
+
+
+class ImportRowError(BaseModel):
+    """Model untuk error validasi per baris import"""
+    line: int
+    error: str
+
+
+class ImportResponse(BaseModel):
+    """Model untuk response bulk import"""
+    total_rows: int = Field(..., description="Jumlah baris data yang diproses")
+    inserted: int
+    failed: int
+    deleted: int = Field(0, description="Jumlah baris kohort lama yang diganti (replace=true)")
+    errors: List[ImportRowError] = Field(..., description="Detail error (dibatasi, lihat errors_truncated)")
+    errors_truncated: bool
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "total_rows": 3,
+                "inserted": 2,
+                "failed": 1,
+                "deleted": 0,
+                "errors": [{"line": 3, "error": "Jenis_Kelamin: Value error, Jenis kelamin harus LK atau PR, bukan 'X'"}],
+                "errors_truncated": False
+            }
+        }
+
+
+class CohortFilter(BaseModel):
+    """Model untuk memilih subset data mahasiswa (kohort) yang dioptimasi"""
+    kohort: Optional[str] = Field(None, max_length=50, description="Tag kohort (mis. fakultas/periode/kampus)")
+    jurusan: Optional[List[str]] = Field(None, min_length=1, description="Hanya mahasiswa dari jurusan ini")
+    ids: Optional[List[int]] = Field(None, min_length=1, description="Hanya mahasiswa dengan ID ini")
+
+    def cohort_key(self) -> str:
+        """
+        Key kanonik filter untuk disimpan di Optimasi.kohort.
+        List ID di-hash agar key tetap pendek.
+        """
+        parts = []
+        if self.kohort is not None:
+            parts.append(f"kohort={self.kohort}")
+        if self.jurusan:
+            parts.append("jurusan=" + ",".join(sorted(set(self.jurusan))))
+        if self.ids:
+            unique_ids = sorted(set(self.ids))
+            digest = hashlib.sha1(",".join(map(str, unique_ids)).encode()).hexdigest()[:12]
+            parts.append(f"ids={len(unique_ids)}:{digest}")
+        key = ";".join(parts) or "all"
+        if len(key) > 255:
+            key = "sha1:" + hashlib.sha1(key.encode()).hexdigest()
+        return key
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "kohort": "FST-2025-GANJIL",
+                "jurusan": ["Teknik Informatika", "Biologi"]
+            }
+        }
+
+
 class OptimizationRequest(BaseModel):
     """Model untuk request optimization"""
     parameters: GAParameters
+    cohort: Optional[CohortFilter] = Field(None, description="Filter kohort; kosong = seluruh tabel data")
+    force: bool = Field(False, description="Jalankan job baru walaupun ada job identik yang berjalan/baru selesai")
+    profile: bool = Field(
+        False, description="Jalankan job di bawah cProfile dan simpan profilnya (selalu job baru, tanpa deduplikasi)"
+    )
 
     class Config:
         json_schema_extra = {
@@ -95,18 +216,61 @@ class OptimizationRequest(BaseModel):
         }
 
 
+class ConstraintUpperBound(BaseModel):
+    """Model untuk upper bound jumlah kelompok yang bisa memenuhi tiap constraint"""
+    C1_HTQ: int
+    C2_Heterogenitas_Jurusan: int
+    C3_Proporsi_Gender: int
+    C4_Jumlah_Anggota: int
+
+
+class PrecheckResponse(BaseModel):
+    """Model untuk response precheck kelayakan target fitness"""
+    jumlah_mahasiswa: int
+    jumlah_kelompok: int
+    max_fitness: int
+    upper_bound: ConstraintUpperBound
+    upper_bound_fitness: int
+    upper_bound_normalized_fitness: float
+    kriteria_penghentian: float
+    effective_kriteria_penghentian: float
+    target_reachable: bool
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "jumlah_mahasiswa": 1900,
+                "jumlah_kelompok": 190,
+                "max_fitness": 760,
+                "upper_bound": {
+                    "C1_HTQ": 150,
+                    "C2_Heterogenitas_Jurusan": 190,
+                    "C3_Proporsi_Gender": 190,
+                    "C4_Jumlah_Anggota": 190
+                },
+                "upper_bound_fitness": 720,
+                "upper_bound_normalized_fitness": 0.947368,
+                "kriteria_penghentian": 0.95,
+                "effective_kriteria_penghentian": 0.947368,
+                "target_reachable": False
+            }
+        }
+
+
 class OptimizationResponse(BaseModel):
     """Model untuk response optimization"""
     id_optimasi: int
     status: str
     message: str
+    deduplicated: bool = Field(False, description="True jika id_optimasi adalah job identik yang sudah ada")
 
     class Config:
         json_schema_extra = {
             "example": {
                 "id_optimasi": 1,
                 "status": "success",
-                "message": "Optimasi berhasil dijalankan"
+                "message": "Optimasi berhasil dijalankan",
+                "deduplicated": False
             }
         }
 
@@ -135,6 +299,17 @@ class OptimizationStatistics(BaseModel):
     total_generations: int
     execution_time_seconds: float
     max_fitness: int
+    upper_bound_fitness: int
+    backend: str
+    encoding: str
+    fitness_mode: str
+    best_graded_fitness: Optional[float] = Field(None, description="Fitness graded individu terbaik (mode graded)")
+    total_evaluations: int
+    cache_hits: int
+    adaptive: bool
+    restarts: int
+    final_cr: float
+    final_mr: float
 
 
 class OptimizationResult(BaseModel):
@@ -142,3 +317,52 @@ class OptimizationResult(BaseModel):
     kelompok_list: List[List[int]] = Field(..., description="List of kelompok berisi ID mahasiswa")
     statistics: OptimizationStatistics
     kelompok_details: List[KelompokDetail]
+
+
+class ProfileFunction(BaseModel):
+    """Model untuk statistik satu fungsi pada profil job"""
+    function: str
+    file: str
+    line: int
+    ncalls: int
+    primitive_calls: int
+    tottime: float = Field(..., description="Waktu di fungsi itu sendiri (detik)")
+    cumtime: float = Field(..., description="Waktu termasuk fungsi yang dipanggil (detik)")
+
+
+class ProfileResponse(BaseModel):
+    """Model untuk response profil job optimasi"""
+    id_optimasi: int
+    status: str
+    profiler: str
+    isolated: bool = Field(
+        True, description="False jika profil ikut merekam job lain (Python 3.12+, job berjalan bersamaan)"
+    )
+    total_seconds: float
+    stages: Dict[str, float] = Field(..., description="Durasi per tahap job (detik)")
+    functions: List[ProfileFunction] = Field(..., description="Top fungsi berdasarkan cumtime")
+    error: Optional[str] = Field(None, description="Alasan profil kosong (mis. profiler lain sedang aktif)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id_optimasi": 1,
+                "status": "completed",
+                "profiler": "cProfile",
+                "isolated": True,
+                "total_seconds": 12.84,
+                "stages": {"ga": 11.92, "save_results": 0.91},
+                "functions": [
+                    {
+                        "function": "run_genetic_algorithm",
+                        "file": "app/ga_engine.py",
+                        "line": 812,
+                        "ncalls": 1,
+                        "primitive_calls": 1,
+                        "tottime": 0.21,
+                        "cumtime": 11.92
+                    }
+                ],
+                "error": None
+            }
+        }
@@ -0,0 +1,142 @@
+"""
+profiling.py
+Profiling per job optimasi (cProfile) untuk mencari hot path di production
+
+Job dengan profile=true dijalankan di bawah cProfile. Ringkasan per fungsi
+(top PROFILE_TOP_N berdasarkan cumulative time) dan dump pstats disimpan ke
+record optimasi, sehingga hot path bisa dianalisis tanpa mereproduksi job.
+
+Sampai Python 3.11 cProfile hanya merekam thread yang mengaktifkannya. Mulai
+Python 3.12 cProfile memakai sys.monitoring dan merekam semua thread, sehingga
+profil ikut berisi job lain di threadpool dan event loop. Karena itu setiap job
+dicatat lewat job_started()/job_finished(); profil yang overlap dengan job lain
+ditandai isolated=False.
+"""
+
+import cProfile
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional, Set
+
+# Jumlah fungsi yang disimpan di ringkasan profil
+PROFILE_TOP_N = int(os.getenv("PROFILE_TOP_N", "50"))
+
+
+# cProfile berbasis sys.monitoring (3.12+) merekam semua thread dalam proses
+PROFILES_ALL_THREADS = sys.version_info >= (3, 12)
+
+_jobs_lock = threading.Lock()
+_running_jobs = 0
+_active_profilers: Set['JobProfiler'] = set()
+
+
+def job_started() -> None:
+    """Catat job optimasi yang mulai berjalan (dipanggil untuk semua job, profiling atau tidak)"""
+    global _running_jobs
+    with _jobs_lock:
+        _running_jobs += 1
+        for profiler in _active_profilers:
+            profiler.overlapped = True
+
+
+def job_finished() -> None:
+    """Catat job optimasi yang selesai"""
+    global _running_jobs
+    with _jobs_lock:
+        _running_jobs -= 1
+
+
+def _short_path(filename: str) -> str:
+    """Path relatif terhadap working directory / site-packages agar ringkasan mudah dibaca"""
+    cwd = os.getcwd() + os.sep
+    if filename.startswith(cwd):
+        return filename[len(cwd):]
+    marker = "site-packages" + os.sep
+    if marker in filename:
+        return filename.split(marker, 1)[1]
+    return filename
+
+
+class JobProfiler:
+    """cProfile untuk satu job optimasi beserta durasi per tahap"""
+
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+        self.stages: Dict[str, float] = {}
+        self.enabled = False
+        self.started = False
+        self.overlapped = False
+        self.error: Optional[str] = None
+        self._started_at: Optional[float] = None
+        self.total_seconds = 0.0
+
+    def start(self) -> None:
+        """Mulai profiling di thread saat ini (job ini sudah dicatat lewat job_started)"""
+        with _jobs_lock:
+            self.overlapped = _running_jobs > 1
+            _active_profilers.add(self)
+        self._started_at = time.perf_counter()
+        try:
+            self.profiler.enable()
+            self.enabled = True
+            self.started = True
+        except ValueError as e:
+            # Python 3.12+: hanya satu profiler aktif per proses, job tetap berjalan tanpa profil
+            self.error = f"Profiler tidak bisa diaktifkan: {e}"
+
+    def stop(self) -> None:
+        """Hentikan profiling (aman dipanggil berulang)"""
+        if self.enabled:
+            self.profiler.disable()
+            self.enabled = False
+        with _jobs_lock:
+            _active_profilers.discard(self)
+        if self._started_at is not None:
+            self.total_seconds = time.perf_counter() - self._started_at
+            self._started_at = None
+
+    def add_stage(self, name: str, seconds: float) -> None:
+        self.stages[name] = round(seconds, 6)
+
+    def _check_started(self) -> None:
+        """Profiler yang belum pernah aktif tidak punya stats (pstats.Stats raise TypeError)"""
+        if not self.started and self.error is None:
+            self.error = "Profiler tidak dijalankan (job gagal sebelum GA dimulai)"
+
+    def summary(self, top_n: int = PROFILE_TOP_N) -> Dict[str, Any]:
+        """Ringkasan profil: durasi total, durasi per tahap, dan top fungsi berdasarkan cumtime"""
+        self._check_started()
+        functions = []
+        if self.error is None:
+            stats = pstats.Stats(self.profiler).stats
+            entries = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:top_n]
+            for (filename, line, name), (primitive_calls, ncalls, tottime, cumtime, _) in entries:
+                functions.append({
+                    'function': name,
+                    'file': _short_path(filename),
+                    'line': line,
+                    'ncalls': ncalls,
+                    'primitive_calls': primitive_calls,
+                    'tottime': round(tottime, 6),
+                    'cumtime': round(cumtime, 6),
+                })
+        return {
+            'profiler': 'cProfile',
+            # False: profil ikut berisi thread lain (Python 3.12+ dengan job lain berjalan bersamaan)
+            'isolated': not (PROFILES_ALL_THREADS and self.overlapped),
+            'total_seconds': round(self.total_seconds, 6),
+            'stages': self.stages,
+            'functions': functions,
+            'error': self.error,
+        }
+
+    def pstats_blob(self) -> Optional[bytes]:
+        """Dump pstats (format sama dengan pstats.Stats.dump_stats), bisa dibuka dengan pstats.Stats(path)"""
+        self._check_started()
+        if self.error is not None:
+            return None
+        return marshal.dumps(pstats.Stats(self.profiler).stats)
@@ -0,0 +1,115 @@
+"""
+benchmark.py
+Benchmark konvergensi GA engine dengan data mahasiswa sintetis
+
+Contoh:
+    python benchmark.py --students 2000 --groups 190 --seeds 3
+    python benchmark.py --encodings permutation group --generation 300
+    python benchmark.py --fitness-modes binary graded --students 5000 --groups 480
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from app.ga_engine import OPERATORS, run_genetic_algorithm
+
+
+def generate_students(n: int, n_majors: int, htq_ratio: float, lk_ratio: float, seed: int) -> List[Dict[str, Any]]:
+    """Generate data mahasiswa sintetis dengan format yang sama seperti Data.to_dict()"""
+    rng = np.random.default_rng(seed)
+    majors = [f"Jurusan {i + 1}" for i in range(n_majors)]
+    # Distribusi jurusan tidak merata, mirip data riil
+    weights = rng.dirichlet(np.ones(n_majors) * 2)
+    return [
+        {
+            "ID": i + 1,
+            "Jenis_Kelamin": "LK" if rng.random() < lk_ratio else "PR",
+            "Jurusan": majors[rng.choice(n_majors, p=weights)],
+            "HTQ": "Ya" if rng.random() < htq_ratio else "Tidak",
+        }
+        for i in range(n)
+    ]
+
+
+def run_benchmark(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Jalankan setiap kombinasi encoding dan fitness mode untuk setiap seed dan kumpulkan statistik"""
+    data = generate_students(args.students, args.majors, args.htq_ratio, args.lk_ratio, args.data_seed)
+    rows = []
+    for encoding, fitness_mode in [(e, m) for e in args.encodings for m in args.fitness_modes]:
+        for seed in range(args.seeds):
+            parameters = {
+                "popsize": args.popsize,
+                "generation": args.generation,
+                "cr": args.cr,
+                "mr": args.mr,
+                "kriteria_penghentian": args.target,
+                "jumlah_kelompok": args.groups,
+                "seed": seed,
+                "encoding": encoding,
+                "adaptive": args.adaptive,
+                "stagnation_limit": args.stagnation_limit,
+                "fitness_mode": fitness_mode,
+            }
+            start = time.time()
+            result = run_genetic_algorithm(data, parameters)
+            stats = result["statistics"]
+            rows.append({
+                "variant": f"{encoding}/{fitness_mode}",
+                "seed": seed,
+                "best_normalized_fitness": stats["best_normalized_fitness"],
+                "total_generations": stats["total_generations"],
+                "total_evaluations": stats["total_evaluations"],
+                "restarts": stats["restarts"],
+                "reached_target": stats["best_normalized_fitness"] >= args.target,
+                "wall_time": time.time() - start,
+            })
+    return rows
+
+
+def print_summary(rows: List[Dict[str, Any]]) -> None:
+    """Print hasil per run dan ringkasan rata-rata per variant (encoding/fitness mode)"""
+    print(f"{'variant':<20} {'seed':>4} {'fitness':>8} {'gens':>6} {'evals':>7} {'restart':>7} {'target':>7} {'time(s)':>8}")
+    for row in rows:
+        print(f"{row['variant']:<20} {row['seed']:>4} {row['best_normalized_fitness']:>8.4f} "
+              f"{row['total_generations']:>6} {row['total_evaluations']:>7} {row['restarts']:>7} "
+              f"{'ya' if row['reached_target'] else '-':>7} {row['wall_time']:>8.2f}")
+
+    print("\nRata-rata:")
+    for variant in dict.fromkeys(r["variant"] for r in rows):
+        subset = [r for r in rows if r["variant"] == variant]
+        print(f"{variant:<20} fitness={np.mean([r['best_normalized_fitness'] for r in subset]):.4f} "
+              f"gens={np.mean([r['total_generations'] for r in subset]):.1f} "
+              f"evals={np.mean([r['total_evaluations'] for r in subset]):.0f} "
+              f"restarts={np.mean([r['restarts'] for r in subset]):.1f} "
+              f"target={sum(r['reached_target'] for r in subset)}/{len(subset)} "
+              f"time={np.mean([r['wall_time'] for r in subset]):.2f}s")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark konvergensi GA KKM")
+    parser.add_argument("--students", type=int, default=2000, help="Jumlah mahasiswa sintetis")
+    parser.add_argument("--groups", type=int, default=190, help="Jumlah kelompok")
+    parser.add_argument("--majors", type=int, default=30, help="Jumlah jurusan")
+    parser.add_argument("--htq-ratio", type=float, default=0.2, help="Proporsi mahasiswa HTQ")
+    parser.add_argument("--lk-ratio", type=float, default=0.45, help="Proporsi mahasiswa laki-laki")
+    parser.add_argument("--data-seed", type=int, default=0, help="Seed untuk data sintetis")
+    parser.add_argument("--popsize", type=int, default=30)
+    parser.add_argument("--generation", type=int, default=200)
+    parser.add_argument("--cr", type=float, default=0.6)
+    parser.add_argument("--mr", type=float, default=0.4)
+    parser.add_argument("--target", type=float, default=0.95, help="kriteria_penghentian")
+    parser.add_argument("--seeds", type=int, default=3, help="Jumlah seed GA per encoding")
+    parser.add_argument("--adaptive", action="store_true", help="Aktifkan adaptive cr/mr")
+    parser.add_argument("--stagnation-limit", type=int, default=0, help="Partial restart setelah N generasi stagnan")
+    parser.add_argument("--encodings", nargs="+", default=list(OPERATORS.keys()), choices=list(OPERATORS.keys()))
+    parser.add_argument("--fitness-modes", nargs="+", default=["binary"], choices=["binary", "graded"],
+                        help="Fitness seleksi: binary (score C1-C4) dan/atau graded (soft penalty)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    print_summary(run_benchmark(args))
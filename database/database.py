@@ -5,6 +5,7 @@ Database configuration and session management
 
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
@@ -18,17 +19,58 @@ DATABASE_URL = os.getenv(
     "mysql+pymysql://root:@localhost:3306/algen_kkm"
 )
 
-# Create engine
+
+def to_async_url(url: str) -> str:
+    """Ganti driver sync dengan driver async (pymysql -> aiomysql, sqlite -> aiosqlite)"""
+    if url.startswith("mysql+pymysql://"):
+        return "mysql+aiomysql://" + url[len("mysql+pymysql://"):]
+    if url.startswith("mysql://"):
+        return "mysql+aiomysql://" + url[len("mysql://"):]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+
+# Async Database URL (default: turunan dari DATABASE_URL)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", to_async_url(DATABASE_URL))
+
+
+def pool_options(url: str) -> dict:
+    """
+    Konfigurasi connection pool dari .env.
+    SQLite (local test) tidak memakai QueuePool sehingga opsi pool dilewati.
+    """
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "3600")),
+        "pool_pre_ping": True,
+    }
+
+
+# Create engine (dipakai background task GA dan create_all)
 engine = create_engine(
     DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    echo=False  # Set to True for SQL query logging
+    echo=False,  # Set to True for SQL query logging
+    **pool_options(DATABASE_URL)
+)
+
+# Create async engine (dipakai request handler FastAPI)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=False,
+    **pool_options(ASYNC_DATABASE_URL)
 )
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create AsyncSessionLocal class
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 # Base class for models
 Base = declarative_base()
 
@@ -44,3 +86,13 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Dependency to get async DB session
+async def get_async_db():
+    """
+    Dependency function untuk mendapatkan async database session
+    Digunakan dengan FastAPI Depends() pada endpoint async def
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,78 @@
+"""
+migrations.py
+Upgrade skema database yang sudah ada
+
+Base.metadata.create_all hanya membuat tabel yang belum ada, tidak menambah
+kolom/index baru ke tabel lama. upgrade_schema() menambahkan kolom dan index
+yang muncul setelah skema awal (idempotent, aman dijalankan setiap startup).
+DDL dibentuk dari definisi model sehingga tipe kolom selalu sama dengan ORM.
+"""
+
+from typing import List, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+from database.database import Base
+import database.models  # noqa: F401 - registrasi tabel ke Base.metadata
+
+# (tabel, kolom) yang ditambahkan setelah skema awal, urut sesuai waktu ditambahkan.
+# Index kolom (index=True di model) ikut dibuat.
+ADDED_COLUMNS: List[Tuple[str, str]] = [
+    ("optimasi", "encoding"),
+    ("optimasi", "jumlah_evaluasi"),
+    ("data", "kohort"),
+    ("optimasi", "kohort"),
+    ("optimasi", "fingerprint"),
+    ("optimasi", "fitness_mode"),
+    ("optimasi", "profil"),
+    ("optimasi", "profil_pstats"),
+]
+
+# (tabel, kolom) lama yang baru diberi index=True
+ADDED_INDEXES: List[Tuple[str, str]] = [
+    ("data", "jurusan"),
+]
+
+
+def _column_ddl(engine: Engine, table_name: str, column_name: str) -> str:
+    """ALTER TABLE ... ADD COLUMN untuk kolom model (selalu nullable, data lama bernilai NULL)"""
+    column = Base.metadata.tables[table_name].c[column_name]
+    column_type = column.type.compile(dialect=engine.dialect)
+    preparer = engine.dialect.identifier_preparer
+    return (
+        f"ALTER TABLE {preparer.quote(table_name)} "
+        f"ADD COLUMN {preparer.quote(column_name)} {column_type} NULL"
+    )
+
+
+def upgrade_schema(engine: Engine) -> List[str]:
+    """
+    Tambahkan kolom (ADDED_COLUMNS) dan index (ADDED_COLUMNS + ADDED_INDEXES)
+    yang belum ada di database.
+    Returns daftar DDL yang dijalankan (kosong jika skema sudah terbaru).
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    executed = []
+
+    with engine.begin() as conn:
+        for table_name, column_name in ADDED_COLUMNS:
+            if table_name not in existing_tables:
+                continue
+            columns = {column["name"] for column in inspector.get_columns(table_name)}
+            if column_name not in columns:
+                ddl = _column_ddl(engine, table_name, column_name)
+                conn.execute(text(ddl))
+                executed.append(ddl)
+
+        for table_name, column_name in ADDED_COLUMNS + ADDED_INDEXES:
+            if table_name not in existing_tables:
+                continue
+            index_names = {index["name"] for index in inspector.get_indexes(table_name)}
+            for index in Base.metadata.tables[table_name].indexes:
+                if [c.name for c in index.columns] == [column_name] and index.name not in index_names:
+                    index.create(conn)
+                    executed.append(f"CREATE INDEX {index.name} ON {table_name} ({column_name})")
+
+    return executed
@@ -3,12 +3,19 @@ db_models.py
 SQLAlchemy ORM models untuk database algen_kkm
 """
 
-from sqlalchemy import Column, BigInteger, Integer, String, Enum, Numeric, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, BigInteger, Integer, String, Enum, Numeric, DateTime, ForeignKey, LargeBinary, Text
+from sqlalchemy.dialects.mysql import MEDIUMBLOB
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from database.database import Base
 
+# BIGINT di MySQL, INTEGER di SQLite (local test) agar autoincrement tetap jalan
+BigIntegerPK = BigInteger().with_variant(Integer, "sqlite")
+
+# BLOB MySQL maksimal 64KB, dump pstats bisa lebih besar
+ProfileBlob = LargeBinary().with_variant(MEDIUMBLOB(), "mysql")
+
 
 def get_jakarta_time():
     """Get current time in Asia/Jakarta timezone"""
@@ -21,10 +28,11 @@ class Data(Base):
     """
     __tablename__ = "data"
     
-    id = Column(BigInteger, primary_key=True, autoincrement=True, index=True)
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True, index=True)
     jenis_kelamin = Column(Enum('LK', 'PR'), nullable=False)
-    jurusan = Column(String(100), nullable=False)
+    jurusan = Column(String(100), nullable=False, index=True)
     htq = Column(Enum('Ya', 'Tidak'), nullable=False)
+    kohort = Column(String(50), nullable=True, index=True)
     created_at = Column(DateTime, default=get_jakarta_time)
     updated_at = Column(DateTime, default=get_jakarta_time, onupdate=get_jakarta_time)
     
@@ -47,7 +55,7 @@ class Optimasi(Base):
     """
     __tablename__ = "optimasi"
     
-    id = Column(BigInteger, primary_key=True, autoincrement=True, index=True)
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True, index=True)
     status = Column(
         Enum('pending', 'processing', 'completed', 'failed'),
         nullable=False,
@@ -59,8 +67,15 @@ class Optimasi(Base):
     mr = Column(Numeric(5, 4), nullable=True)
     kriteria_penghentian = Column(Numeric(5, 4), nullable=True)
     jumlah_kelompok = Column(Integer, nullable=True)
+    encoding = Column(String(20), nullable=True, default='permutation')
+    fitness_mode = Column(String(20), nullable=True, default='binary')
+    kohort = Column(String(255), nullable=True, index=True)
+    fingerprint = Column(String(64), nullable=True, index=True)
     fitness_terbaik = Column(Numeric(10, 6), nullable=True)
     waktu_eksekusi = Column(Integer, nullable=True)
+    jumlah_evaluasi = Column(Integer, nullable=True)
+    profil = Column(Text, nullable=True)
+    profil_pstats = deferred(Column(ProfileBlob, nullable=True))
     created_at = Column(DateTime, default=get_jakarta_time)
     updated_at = Column(DateTime, default=get_jakarta_time, onupdate=get_jakarta_time)
     
@@ -74,7 +89,7 @@ class Kelompok(Base):
     """
     __tablename__ = "kelompoks"
     
-    id = Column(BigInteger, primary_key=True, autoincrement=True, index=True)
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True, index=True)
     id_optimasi = Column(BigInteger, ForeignKey('optimasi.id'), nullable=False)
     id_data = Column(BigInteger, ForeignKey('data.id'), nullable=False)
     kelompok = Column(Integer, nullable=False)
@@ -0,0 +1,12 @@
+"""
+conftest.py
+Test yang meng-import app.main memakai database SQLite sementara
+(app.main menjalankan create_all / upgrade_schema saat import)
+"""
+
+import os
+import tempfile
+
+_db_dir = tempfile.mkdtemp(prefix="algen_kkm_test_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ.pop("ASYNC_DATABASE_URL", None)
@@ -0,0 +1,91 @@
+"""
+test_dedup.py
+Deduplikasi submission: job in-flight tetap dipakai ulang melewati TTL selama
+belum stale, job completed kedaluwarsa setelah OPTIMIZE_DEDUP_TTL, dan job
+sisa proses sebelumnya ditandai failed saat startup.
+"""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import delete
+
+from app import main
+from database.database import AsyncSessionLocal, SessionLocal
+from database.models import Optimasi, get_jakarta_time
+
+FINGERPRINT = "f" * 64
+
+
+@pytest.fixture(autouse=True)
+def dedup_settings(monkeypatch):
+    monkeypatch.setattr(main, "OPTIMIZE_DEDUP_TTL", 3600)
+    monkeypatch.setattr(main, "OPTIMIZE_STALE_AFTER", 86400)
+    with SessionLocal() as db:
+        db.execute(delete(Optimasi))
+        db.commit()
+
+
+def add_job(status: str, age_seconds: float) -> int:
+    """Job dengan updated_at age_seconds yang lalu"""
+    updated_at = get_jakarta_time() - timedelta(seconds=age_seconds)
+    with SessionLocal() as db:
+        job = Optimasi(status=status, fingerprint=FINGERPRINT, created_at=updated_at, updated_at=updated_at)
+        db.add(job)
+        db.commit()
+        return job.id
+
+
+def find_duplicate():
+    async def run():
+        async with AsyncSessionLocal() as db:
+            job = await main.find_duplicate_job(db, FINGERPRINT)
+            return job.id if job else None
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("status", ["pending", "processing"])
+def test_in_flight_matches_past_ttl(status):
+    job_id = add_job(status, age_seconds=2 * 3600)
+    assert find_duplicate() == job_id
+
+
+def test_in_flight_stale_does_not_match():
+    add_job("processing", age_seconds=86400 + 60)
+    assert find_duplicate() is None
+
+
+def test_completed_matches_within_ttl():
+    job_id = add_job("completed", age_seconds=3600 - 60)
+    assert find_duplicate() == job_id
+
+
+def test_completed_expires_at_ttl():
+    add_job("completed", age_seconds=3600 + 60)
+    assert find_duplicate() is None
+
+
+def test_failed_never_matches():
+    add_job("failed", age_seconds=0)
+    assert find_duplicate() is None
+
+
+def test_dedup_disabled(monkeypatch):
+    monkeypatch.setattr(main, "OPTIMIZE_DEDUP_TTL", 0)
+    add_job("processing", age_seconds=0)
+    assert find_duplicate() is None
+
+
+def test_startup_fails_orphaned_jobs():
+    add_job("pending", age_seconds=0)
+    add_job("processing", age_seconds=60)
+    completed_id = add_job("completed", age_seconds=60)
+
+    assert main.fail_orphaned_jobs() == 2
+    with SessionLocal() as db:
+        statuses = {job.id: job.status for job in db.query(Optimasi)}
+    assert statuses[completed_id] == "completed"
+    assert sorted(statuses.values()) == ["completed", "failed", "failed"]
+    # Job yang tidak akan pernah selesai tidak lagi dipakai deduplikasi
+    assert find_duplicate() == completed_id
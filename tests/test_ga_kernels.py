@@ -0,0 +1,57 @@
+"""
+test_ga_kernels.py
+Backend numba dan numpy harus menghasilkan output identik untuk seed yang sama
+"""
+
+import pytest
+
+from app import ga_kernels
+from app.ga_engine import run_genetic_algorithm
+from benchmark import generate_students
+
+BASE_PARAMETERS = {
+    "popsize": 12,
+    "generation": 25,
+    "cr": 0.6,
+    "mr": 0.4,
+    "kriteria_penghentian": 1.0,
+    "jumlah_kelompok": 24,
+    "seed": 3,
+    "stagnation_limit": 5,
+}
+
+
+@pytest.fixture(scope="module")
+def students():
+    return generate_students(250, 12, 0.2, 0.45, seed=0)
+
+
+@pytest.mark.skipif("numba" not in ga_kernels.available_backends(), reason="numba tidak terpasang")
+@pytest.mark.parametrize("encoding", ["permutation", "group"])
+@pytest.mark.parametrize("fitness_mode", ["binary", "graded"])
+@pytest.mark.parametrize("adaptive", [False, True])
+def test_backends_identical_for_same_seed(students, encoding, fitness_mode, adaptive):
+    parameters = {**BASE_PARAMETERS, "encoding": encoding, "fitness_mode": fitness_mode, "adaptive": adaptive}
+    results = {
+        backend: run_genetic_algorithm(students, {**parameters, "backend": backend})
+        for backend in ("numpy", "numba")
+    }
+    numpy_result, numba_result = results["numpy"], results["numba"]
+
+    assert numpy_result["kelompok_list"] == numba_result["kelompok_list"]
+    assert numpy_result["kelompok_details"] == numba_result["kelompok_details"]
+    for key in ("best_fitness", "best_graded_fitness", "total_generations", "total_evaluations",
+                "cache_hits", "restarts", "final_cr", "final_mr"):
+        assert numpy_result["statistics"][key] == numba_result["statistics"][key], key
+
+
+def test_forced_backend_must_be_available(monkeypatch):
+    monkeypatch.setenv("GA_BACKEND", "tidak-ada")
+    with pytest.raises(ValueError):
+        ga_kernels.get_backend()
+
+
+def test_auto_backend_prefers_numba(monkeypatch):
+    monkeypatch.setenv("GA_BACKEND", "auto")
+    expected = "numba" if "numba" in ga_kernels.available_backends() else "numpy"
+    assert ga_kernels.get_backend().name == expected
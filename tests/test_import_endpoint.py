@@ -0,0 +1,96 @@
+"""
+test_import_endpoint.py
+POST /api/data/import: ID duplikat menjadi error baris (import tetap berjalan),
+replace ditolak untuk kohort yang sudah dipakai hasil optimasi
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, func, select
+
+from app import main
+from database.database import SessionLocal
+from database.models import Data, Kelompok, Optimasi
+
+HEADER = "ID,Jenis_Kelamin,Jurusan,HTQ\n"
+
+
+@pytest.fixture
+def client():
+    with SessionLocal() as db:
+        db.execute(delete(Kelompok))
+        db.execute(delete(Optimasi))
+        db.execute(delete(Data))
+        db.commit()
+    return TestClient(main.app)
+
+
+def csv_body(ids) -> str:
+    return HEADER + "".join(f"{i},{'LK' if i % 2 else 'PR'},Jurusan {i % 3},Ya\n" for i in ids)
+
+
+def post_import(client, body: str, **params):
+    return client.post("/api/data/import", params=params, content=body.encode(),
+                       headers={"Content-Type": "text/csv"})
+
+
+def count_data(kohort=None) -> int:
+    with SessionLocal() as db:
+        query = select(func.count(Data.id))
+        if kohort is not None:
+            query = query.where(Data.kohort == kohort)
+        return db.execute(query).scalar_one()
+
+
+def test_existing_id_is_row_error(client, monkeypatch):
+    monkeypatch.setattr(main, "IMPORT_BATCH_SIZE", 25)
+    assert post_import(client, csv_body([1]), kohort="A").status_code == 200
+
+    # 60 baris valid + 1 baris memakai ID yang sudah ada (baris ke-31 file)
+    ids = list(range(100, 130)) + [1] + list(range(130, 160))
+    response = post_import(client, csv_body(ids), kohort="B")
+
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["total_rows"], result["inserted"], result["failed"]) == (61, 60, 1)
+    assert result["errors"][0]["line"] == 32
+    assert "sudah ada" in result["errors"][0]["error"]
+    assert count_data("B") == 60
+
+
+def test_duplicate_id_in_file_is_row_error(client):
+    response = post_import(client, csv_body([10, 11, 10, 12]))
+
+    result = response.json()
+    assert response.status_code == 200
+    assert (result["inserted"], result["failed"]) == (3, 1)
+    assert result["errors"][0]["line"] == 4
+    assert count_data() == 3
+
+
+def test_replace_unoptimized_cohort(client):
+    post_import(client, csv_body([1, 2, 3]), kohort="A")
+    # ID milik kohort yang diganti boleh dipakai lagi
+    response = post_import(client, csv_body([2, 3, 4, 5]), kohort="A", replace="true")
+
+    result = response.json()
+    assert response.status_code == 200
+    assert (result["deleted"], result["inserted"], result["failed"]) == (3, 4, 0)
+    assert count_data("A") == 4
+
+
+def test_replace_optimized_cohort_rejected(client):
+    post_import(client, csv_body([1, 2, 3]), kohort="A")
+    with SessionLocal() as db:
+        optimasi = Optimasi(status="completed", kohort="A")
+        db.add(optimasi)
+        db.flush()
+        db.add_all([Kelompok(id_optimasi=optimasi.id, id_data=i, kelompok=1) for i in (1, 2, 3)])
+        db.commit()
+        optimasi_id = optimasi.id
+
+    response = post_import(client, csv_body([1, 2]), kohort="A", replace="true")
+
+    assert response.status_code == 409
+    assert str(optimasi_id) in response.json()["detail"]
+    assert count_data("A") == 3
@@ -0,0 +1,52 @@
+"""
+test_importer.py
+Parsing streaming CSV/NDJSON untuk bulk import
+"""
+
+import asyncio
+
+from app.importer import iter_lines, iter_records
+
+
+def parse(body: bytes, fmt: str, chunk_size: int = 7):
+    """Jalankan iter_records atas body yang dipecah per chunk kecil"""
+    async def chunks():
+        for i in range(0, len(body), chunk_size):
+            yield body[i:i + chunk_size]
+
+    async def collect():
+        return [item async for item in iter_records(iter_lines(chunks()), fmt)]
+
+    return asyncio.run(collect())
+
+
+def test_csv_quoted_newline_is_one_record():
+    body = b'Jenis_Kelamin,Jurusan,HTQ\r\nLK,"Teknik\r\nSipil",Ya\r\nPR,"Biologi ""Murni""",Tidak\r\nPR,Kimia,Tidak\r\n'
+    records = parse(body, 'csv')
+
+    assert [line_no for line_no, _ in records] == [2, 4, 5]
+    assert records[0][1] == {'Jenis_Kelamin': 'LK', 'Jurusan': 'Teknik\nSipil', 'HTQ': 'Ya'}
+    assert records[1][1]['Jurusan'] == 'Biologi "Murni"'
+
+
+def test_csv_unclosed_quote_reported():
+    records = parse(b'Jenis_Kelamin,Jurusan,HTQ\nLK,"Teknik,Ya\nPR,Kimia,Tidak\n', 'csv')
+
+    assert len(records) == 1
+    line_no, error = records[0]
+    assert line_no == 2 and isinstance(error, ValueError)
+
+
+def test_csv_stray_quote_inside_unquoted_field():
+    records = parse(b'Jenis_Kelamin,Jurusan,HTQ\nLK,5",Ya\nPR,Kimia,Tidak\n', 'csv')
+
+    assert [line_no for line_no, _ in records] == [2, 3]
+    assert records[0][1]['Jurusan'] == '5"'
+
+
+def test_ndjson_invalid_line_keeps_line_number():
+    records = parse(b'{"Jenis_Kelamin": "LK", "Jurusan": "A", "HTQ": "Ya"}\n[1]\n{"id": 5}\n', 'ndjson')
+
+    assert [line_no for line_no, _ in records] == [1, 2, 3]
+    assert isinstance(records[1][1], ValueError)
+    assert records[2][1] == {'ID': 5}
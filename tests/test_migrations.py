@@ -0,0 +1,69 @@
+"""
+test_migrations.py
+upgrade_schema harus membawa database dengan skema awal ke skema model terbaru
+
+Setiap kolom/index baru di database/models.py wajib didaftarkan di
+ADDED_COLUMNS / ADDED_INDEXES; test ini gagal jika ada yang terlewat.
+"""
+
+from sqlalchemy import (BigInteger, Column, DateTime, Enum, ForeignKey, Integer, MetaData, Numeric, String,
+                        Table, create_engine, inspect)
+
+from database.database import Base
+from database.migrations import upgrade_schema
+
+
+def create_initial_schema(engine):
+    """Skema tabel sebelum ada kolom/index tambahan (sesuai versi awal database/models.py)"""
+    metadata = MetaData()
+    Table(
+        "data", metadata,
+        Column("id", Integer, primary_key=True, index=True),
+        Column("jenis_kelamin", Enum('LK', 'PR'), nullable=False),
+        Column("jurusan", String(100), nullable=False),
+        Column("htq", Enum('Ya', 'Tidak'), nullable=False),
+        Column("created_at", DateTime),
+        Column("updated_at", DateTime),
+    )
+    Table(
+        "optimasi", metadata,
+        Column("id", Integer, primary_key=True, index=True),
+        Column("status", Enum('pending', 'processing', 'completed', 'failed'), nullable=False),
+        Column("popsize", Integer),
+        Column("generation", Integer),
+        Column("cr", Numeric(5, 4)),
+        Column("mr", Numeric(5, 4)),
+        Column("kriteria_penghentian", Numeric(5, 4)),
+        Column("jumlah_kelompok", Integer),
+        Column("fitness_terbaik", Numeric(10, 6)),
+        Column("waktu_eksekusi", Integer),
+        Column("created_at", DateTime),
+        Column("updated_at", DateTime),
+    )
+    Table(
+        "kelompoks", metadata,
+        Column("id", Integer, primary_key=True, index=True),
+        Column("id_optimasi", BigInteger, ForeignKey("optimasi.id"), nullable=False),
+        Column("id_data", BigInteger, ForeignKey("data.id"), nullable=False),
+        Column("kelompok", Integer, nullable=False),
+        Column("created_at", DateTime),
+        Column("updated_at", DateTime),
+    )
+    metadata.create_all(engine)
+
+
+def test_upgrade_initial_schema_to_models(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'initial.db'}")
+    create_initial_schema(engine)
+
+    assert upgrade_schema(engine)
+    # Idempotent: run kedua tidak mengubah apa pun
+    assert upgrade_schema(engine) == []
+
+    inspector = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        assert columns == set(table.columns.keys()), table.name
+
+        index_names = {index["name"] for index in inspector.get_indexes(table.name)}
+        assert {index.name for index in table.indexes} <= index_names, table.name
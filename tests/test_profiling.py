@@ -0,0 +1,65 @@
+"""
+test_profiling.py
+JobProfiler: ringkasan profil untuk job yang gagal sebelum profiler dijalankan
+"""
+
+import json
+
+import pytest
+
+import database.database
+from app import main
+from app.profiling import JobProfiler
+from database.database import SessionLocal
+from database.models import Optimasi
+
+
+def test_never_started_profiler_reports_error():
+    profiler = JobProfiler()
+    profiler.stop()
+
+    summary = profiler.summary()
+    assert summary['functions'] == []
+    assert summary['error'] is not None
+    assert profiler.pstats_blob() is None
+
+
+def test_started_profiler_collects_functions():
+    profiler = JobProfiler()
+    profiler.start()
+    sorted(range(1000), key=lambda x: -x)
+    profiler.stop()
+
+    assert profiler.summary()['error'] is None
+    assert profiler.summary()['functions']
+    assert profiler.pstats_blob()
+
+
+def test_failure_before_profiling_keeps_original_exception(monkeypatch):
+    with SessionLocal() as db:
+        optimasi = Optimasi(status="pending")
+        db.add(optimasi)
+        db.commit()
+        optimasi_id = optimasi.id
+
+    class FailingFirstCommit(database.database.SessionLocal.class_):
+        commits = 0
+
+        def commit(self):
+            FailingFirstCommit.commits += 1
+            if FailingFirstCommit.commits == 1:
+                raise RuntimeError("commit status processing gagal")
+            super().commit()
+
+    monkeypatch.setattr(database.database, "SessionLocal",
+                        database.database.sessionmaker(bind=database.database.engine, class_=FailingFirstCommit))
+    main.metrics.JOBS_QUEUED.inc()
+
+    with pytest.raises(RuntimeError, match="processing gagal"):
+        main.process_optimization(optimasi_id, [], {}, profile=True)
+
+    with SessionLocal() as db:
+        optimasi = db.get(Optimasi, optimasi_id)
+        assert optimasi.status == "failed"
+        assert json.loads(optimasi.profil)['error'] is not None
+        assert optimasi.profil_pstats is None
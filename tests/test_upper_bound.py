@@ -0,0 +1,61 @@
+"""
+test_upper_bound.py
+estimate_upper_bound dibandingkan dengan brute force semua partisi pada kohort kecil
+
+Target GA dibatasi upper bound (kriteria penghentian), sehingga bound yang
+terlalu rendah membuat GA berhenti sebelum solusi terbaik ditemukan.
+"""
+
+from itertools import permutations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ga_engine import evaluate_groups, preprocess_data
+from app.ga_kernels import get_backend
+
+CONSTRAINTS = ['C1_HTQ', 'C2_Heterogenitas_Jurusan', 'C3_Proporsi_Gender', 'C4_Jumlah_Anggota']
+
+
+def random_cohort(rng: np.random.Generator, n: int):
+    n_majors = int(rng.integers(1, n + 1))
+    htq_ratio = rng.random()
+    lk_ratio = rng.random()
+    return [
+        {
+            "ID": i + 1,
+            "Jenis_Kelamin": "LK" if rng.random() < lk_ratio else "PR",
+            "Jurusan": f"J{int(rng.integers(n_majors))}",
+            "HTQ": "Ya" if rng.random() < htq_ratio else "Tidak",
+        }
+        for i in range(n)
+    ]
+
+
+def brute_force_maxima(preprocessed):
+    """Nilai maksimal tiap constraint dan total fitness dari semua permutasi"""
+    kernels = get_backend('numpy')
+    best = np.zeros(len(CONSTRAINTS), dtype=np.int64)
+    best_total = 0
+    for perm in permutations(range(preprocessed['N'])):
+        sums = np.array([c.sum() for c in evaluate_groups(np.array(perm), preprocessed, kernels)])
+        best = np.maximum(best, sums)
+        best_total = max(best_total, int(sums.sum()))
+    return dict(zip(CONSTRAINTS, best.tolist())), best_total
+
+
+@pytest.mark.parametrize("case", range(60))
+def test_upper_bound_valid_and_tight(case):
+    rng = np.random.default_rng(case)
+    n = int(rng.integers(2, 8))
+    k = int(rng.integers(1, n + 1))
+    preprocessed = preprocess_data(pd.DataFrame(random_cohort(rng, n)), k)
+    upper_bound = preprocessed['upper_bound']
+
+    maxima, best_total = brute_force_maxima(preprocessed)
+
+    assert best_total <= upper_bound['total']
+    for name in CONSTRAINTS:
+        # Valid (tidak pernah terlampaui) dan exact per constraint
+        assert maxima[name] == upper_bound[name], name